@@ -1,12 +1,60 @@
 # main.py
+import heapq
+import logging
 import os
+import re
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 
 from src.fileworker import JSONFileWorker, CSVFileWorker
 from src.hh_api import HeadHunterAPI
-from src.vacancy import Vacancy
+from src.vacancy import SALARY_KEY, Vacancy
+
+# С какого количества записей конвертация в Vacancy распараллеливается
+# по процессам (на мелких объемах накладные расходы пула не окупаются)
+PARALLEL_THRESHOLD = 2000
+
+
+def build_vacancies(data):
+    """Конвертирует записи файла в список Vacancy, некорректные пропускает.
+
+    Записи идут в Vacancy.from_records батчами: HTML чистится одним
+    проходом regex-движка, роли кэшируются на батч. Крупные наборы
+    делятся на куски и обрабатываются пулом процессов — построение
+    Vacancy чисто вычислительное, записи независимы.
+    """
+    # Тот же пре-фильтр, что и в build_vacancy: Mapping с id и названием
+    valid = [
+        item
+        for item in data
+        if isinstance(item, Mapping)
+        and 'id' in item
+        and (item.get('title') or item.get('name'))
+    ]
+    if len(valid) > PARALLEL_THRESHOLD:
+        chunks = [
+            valid[start:start + 256] for start in range(0, len(valid), 256)
+        ]
+        with ProcessPoolExecutor() as executor:
+            built = executor.map(Vacancy.from_records, chunks)
+            return [v for page in built for v in page]
+    return Vacancy.from_records(valid)
+
+
+def display_line(vacancy):
+    """Готовит строку отображения вакансии: роль | зарплата | город."""
+    professional_role = ", ".join(
+        vacancy.professional_roles) if vacancy.professional_roles else "Не указано"
+    salary_part = vacancy.salary_info
+    city_part = vacancy.city if vacancy.city != "Не указан" else ""
+    return " | ".join(filter(None, [professional_role, salary_part, city_part]))
 
 
 def main():
+    # Диагностика модулей идет через logging; в CLI показываем ее как
+    # обычные сообщения, без служебных префиксов
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     print("Добро пожаловать в систему поиска вакансий с HeadHunter!\n")
 
     # Выбор формата файла для сохранения
@@ -62,18 +110,7 @@ def main():
                 print("В файле нет сохранённых вакансий.\n")
             else:
                 # Преобразуем данные в список Vacancy объектов
-                vacancies = []
-                for item in data:
-                    try:
-                        if not isinstance(item, dict):
-                            continue
-                        # Проверяем наличие id и хотя бы одного из полей title или name
-                        if 'id' not in item or (not item.get('title') and not item.get('name')):
-                            continue
-                        vacancy = Vacancy(item)
-                        vacancies.append(vacancy)
-                    except (ValueError, KeyError, TypeError, AttributeError):
-                        continue
+                vacancies = build_vacancies(data)
 
                 if not vacancies:
                     print("Не удалось загрузить вакансии из файла.\n")
@@ -89,15 +126,14 @@ def main():
                 if view_choice == "1":
                     # Показать все вакансии
                     print(f"\nСохранённые вакансии ({len(vacancies)} шт.):")
-                    for i, vacancy in enumerate(vacancies, 1):
-                        # Отображаем профессиональную роль вместо названия
-                        professional_role = ", ".join(
-                            vacancy.professional_roles) if vacancy.professional_roles else "Не указано"
-                        salary_part = vacancy.salary_info
-                        city_part = vacancy.city if vacancy.city != "Не указан" else ""
-                        parts = [professional_role, salary_part, city_part]
-                        print(f"{i}. {' | '.join(filter(None, parts))}")
-                    print()
+                    # Копим строки и выводим одним print: одна запись в stdout
+                    # вместо сисколла на каждую вакансию
+                    # Строка отображения считается один раз на вакансию
+                    lines = [
+                        f"{i}. {display_line(vacancy)}"
+                        for i, vacancy in enumerate(vacancies, 1)
+                    ]
+                    print("\n".join(lines) + "\n")
 
                 elif view_choice == "2":
                     # Показать топ N вакансий по зарплате
@@ -112,46 +148,48 @@ def main():
                         except ValueError:
                             print("Некорректный ввод. Пожалуйста, введите целое число.\n")
 
-                    # Сортируем по средней зарплате (по убыванию)
-                    sorted_vacancies = sorted(vacancies, key=lambda v: v.average_salary(), reverse=True)
-                    top_n = sorted_vacancies[:n]
+                    # Отбираем топ N по средней зарплате: O(N log n) вместо
+                    # полной сортировки, ключ считается один раз на вакансию
+                    top_n = heapq.nlargest(n, vacancies, key=SALARY_KEY)
 
                     print(f"\nТоп {len(top_n)} вакансий по зарплате:")
+                    lines = []
                     for i, vacancy in enumerate(top_n, 1):
                         avg_salary = int(vacancy.average_salary())
                         salary_str = f"{avg_salary:,} {vacancy.currency}" if avg_salary > 0 else "Зарплата не указана"
                         # Отображаем профессиональную роль вместо названия
                         professional_role = ", ".join(
                             vacancy.professional_roles) if vacancy.professional_roles else "Не указано"
-                        print(
+                        lines.append(
                             f"{i}. {professional_role} | {salary_str} | {vacancy.city if vacancy.city != 'Не указан' else ''}")
-                    print()
+                    print("\n".join(lines) + "\n")
 
                 elif view_choice == "3":
                     # Поиск по ключевому слову в описании
-                    keyword = input("Введите ключевое слово для поиска в описании: ").strip().lower()
+                    keyword = input("Введите ключевое слово для поиска в описании: ").strip().casefold()
                     if not keyword:
                         print("Ключевое слово не может быть пустым.\n")
                         continue
 
-                    # Ищем вакансии, содержащие ключевое слово в responsibilities или requirements
-                    matching_vacancies = []
-                    for vacancy in vacancies:
-                        description = (vacancy.responsibilities + " " + vacancy.requirements).lower()
-                        if keyword in description:
-                            matching_vacancies.append(vacancy)
+                    # Ищем вакансии, содержащие ключевое слово в responsibilities или requirements.
+                    # Один скомпилированный регистронезависимый шаблон, поиск
+                    # по обоим полям напрямую — без склейки строк и без
+                    # создания копий в нижнем регистре на каждую вакансию
+                    pattern = re.compile(re.escape(keyword), re.IGNORECASE)
+                    matching_vacancies = [
+                        vacancy
+                        for vacancy in vacancies
+                        if pattern.search(vacancy.responsibilities)
+                        or pattern.search(vacancy.requirements)
+                    ]
 
                     if matching_vacancies:
                         print(f"\nНайдено вакансий с ключевым словом «{keyword}»: {len(matching_vacancies)}")
-                        for i, vacancy in enumerate(matching_vacancies, 1):
-                            # Отображаем профессиональную роль вместо названия
-                            professional_role = ", ".join(
-                                vacancy.professional_roles) if vacancy.professional_roles else "Не указано"
-                            salary_part = vacancy.salary_info
-                            city_part = vacancy.city if vacancy.city != "Не указан" else ""
-                            parts = [professional_role, salary_part, city_part]
-                            print(f"{i}. {' | '.join(filter(None, parts))}")
-                        print()
+                        lines = [
+                            f"{i}. {display_line(vacancy)}"
+                            for i, vacancy in enumerate(matching_vacancies, 1)
+                        ]
+                        print("\n".join(lines) + "\n")
                     else:
                         print(f"\nВакансии с ключевым словом «{keyword}» не найдены.\n")
 
@@ -161,14 +199,14 @@ def main():
         elif action == "3":
             if os.path.exists(file_worker.filename):
                 size = os.path.getsize(file_worker.filename)
-                print(f"Текущий размер файла: {size} байт ({len(file_worker.load_data())} записей)")
+                print(f"Текущий размер файла: {size} байт ({file_worker.count_records()} записей)")
 
             confirm = input("Вы уверены, что хотите очистить файл? (да/нет): ").strip().lower()
             if confirm in ("да", "yes", "y"):
                 file_worker.clear_file()
                 parser.clear_vacancies()
-                after_clear = file_worker.load_data()
-                print(f"После очистки: {len(after_clear)} записей")
+                # После успешной очистки файл пуст — перечитывать его незачем
+                print("После очистки: 0 записей")
             else:
                 print("Очищение отменено.\n")
 
@@ -1,8 +1,88 @@
 import csv
 import json
+import logging
+import mmap
 import os
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson — опциональное ускорение, stdlib json как запасной вариант
+    orjson = None
+
+
+def _json_dumps(data: Any, pretty: bool = False) -> bytes:
+    """Сериализует данные в JSON-байты (через orjson, если он установлен).
+
+    По умолчанию — компактный вывод: файл читается только программой,
+    а отступы увеличивают его объем (и время последующего разбора)
+    примерно в полтора раза. pretty=True оставлен для отладки.
+    """
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(raw: Any) -> Any:
+    """Разбирает JSON-байты (через orjson, если он установлен).
+
+    Принимает любой bytes-like объект, в том числе memoryview поверх mmap.
+    """
+
+    if orjson is not None:
+        return orjson.loads(raw)
+    if not isinstance(raw, bytes):
+        raw = bytes(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+# Файлы меньше этого порога читаются обычным read():
+# на мелких файлах накладные расходы mmap не окупаются
+_MMAP_THRESHOLD = 64 * 1024
+
+# fsync перед os.replace — защита от потери данных при сбое питания,
+# но это полный дисковый барьер (~10 мс) на каждую запись. os.replace
+# атомарен и без него: усеченного JSON не будет, поэтому по умолчанию
+# барьер выключен; HH_FSYNC=1 включает его для критичных сценариев
+_FSYNC = os.environ.get("HH_FSYNC") == "1"
+
+
+logger = logging.getLogger(__name__)
+
+
+class _CSVRow(Mapping):
+    """Ленивое представление строки CSV.
+
+    Все строки одного файла разделяют общий словарь "имя колонки -> номер",
+    сами значения хранятся кортежем — в отличие от DictReader, который
+    собирает полноценный словарь на каждую строку.
+    """
+
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, index: Dict[str, int], values: Tuple[Any, ...]):
+        self._index = index
+        self._values = values
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._index[key]]
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
 
 
 class AbstractFileWorker(ABC):
@@ -31,6 +111,19 @@ class AbstractFileWorker(ABC):
         """Полностью очистить файл."""
         pass
 
+    def _set_cache(self, data: List[Dict[str, Any]]) -> None:
+        """Запоминает текущее содержимое файла и множество его id."""
+
+        self._cache = data
+        self._ids = {item.get("id") for item in data if item.get("id")}
+
+    def count_records(self) -> int:
+        """Количество записей в файле: O(1) при прогретом кэше."""
+
+        if self._cache is not None:
+            return len(self._cache)
+        return len(self.load_data())
+
 
 class JSONFileWorker(AbstractFileWorker):
     """
@@ -42,6 +135,13 @@ class JSONFileWorker(AbstractFileWorker):
 
     def __init__(self, filename: str = "data/vacancies.json"):
         self.__filename = filename  # приватный атрибут
+        # Кэш разобранного файла и множество известных id:
+        # избавляет от повторного чтения файла на горячих путях
+        self._cache: Optional[List[Dict[str, Any]]] = None
+        self._ids: set = set()
+        # Файла еще нет (свежий клон) — первое сохранение идет сразу
+        # в запись, без stat/open/parse несуществующего файла
+        self._file_missing = not os.path.exists(filename)
         # Создаем директорию, если её нет
         dir_path = os.path.dirname(filename)
         if dir_path and not os.path.exists(dir_path):
@@ -54,50 +154,147 @@ class JSONFileWorker(AbstractFileWorker):
         return self.__filename
 
     def load_data(self) -> List[Dict[str, Any]]:
+        if self._cache is not None:
+            return self._cache
         if not os.path.exists(self.__filename):
-            return []
+            self._set_cache([])
+            return self._cache
         try:
-            with open(self.__filename, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            # Читаем файл в бинарном режиме одним куском: так парсер
+            # не проходит через слой текстового декодирования.
+            # Буфер в 1 МиБ сокращает число read()-сисколлов на больших файлах;
+            # крупные файлы отображаем через mmap, экономя полную копию байтов
+            with open(self.__filename, "rb", buffering=1 << 20) as f:
+                if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    try:
+                        data = _json_loads(memoryview(mm))
+                    finally:
+                        mm.close()
+                else:
+                    data = _json_loads(f.read())
 
             if not isinstance(data, list):
-                print(f"[ERROR] Корневой элемент не список: {type(data)}")
+                logger.error("[ERROR] Корневой элемент не список: %s", type(data))
                 return []
 
+            logger.debug("Загружено %d записей из %s", len(data), self.__filename)
+            self._set_cache(data)
             return data
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"[ERROR] Чтение файла {self.__filename}: {e}")
+        except (ValueError, IOError) as e:
+            logger.error("[ERROR] Чтение файла %s: %s", self.__filename, e)
             return []
 
     def save_data(self, data: List[Dict[str, Any]]) -> None:
-        # Проверка: все элементы должны быть словарями
-        for i, item in enumerate(data):
-            if not isinstance(item, dict):
-                print(
-                    f"[ERROR] Запись №{i} не словарь: type={type(item)}, value={repr(item)}"
-                )
-                raise ValueError("Данные для сохранения должны быть словарями")
-
         try:
-            if os.path.exists(self.__filename):
-                with open(self.__filename, "r", encoding="utf-8") as f:
+            if self._cache is not None:
+                existing_data = self._cache
+                seen_ids = set(self._ids)
+            elif not self._file_missing and os.path.exists(self.__filename):
+                with open(self.__filename, "rb") as f:
                     try:
-                        existing_data = json.load(f)
-                    except json.JSONDecodeError:
+                        existing_data = _json_loads(f.read())
+                    except ValueError:
                         existing_data = []
+                seen_ids = {
+                    item.get("id") for item in existing_data if item.get("id")
+                }
             else:
                 existing_data = []
+                seen_ids = set()
+
+            # Один проход по данным: проверка типа и отбор уникальных id сразу.
+            # Диагностика идет через logging.DEBUG — при выключенном логгере
+            # это no-op вместо форматирования строки и записи в stdout
+            unique_new: List[Dict[str, Any]] = []
+            append = unique_new.append
+            for i, item in enumerate(data):
+                if not isinstance(item, dict):
+                    logger.debug(
+                        "Запись №%d не словарь: type=%s, value=%r", i, type(item), item
+                    )
+                    raise ValueError("Данные для сохранения должны быть словарями")
+                iid = item.get("id")
+                if iid:
+                    if iid in seen_ids:
+                        continue
+                    seen_ids.add(iid)
+                append(item)
+
+            # Все записи уже есть в файле — ни сериализации, ни записи не нужно
+            if not unique_new:
+                return
 
-            existing_ids = {item.get("id") for item in existing_data if item.get("id")}
-            unique_new = [item for item in data if item.get("id") not in existing_ids]
+            # Быстрый путь: кэш прогрет, значит массив на диске актуален —
+            # дописываем только новые записи вместо полной перезаписи.
+            # existing_data здесь и есть кэш, так что расширяем его на месте
+            # без аллокации объединенного списка
+            if (
+                self._cache is not None
+                and not self._file_missing
+                and os.path.exists(self.__filename)
+                and self._append_records(unique_new, bool(existing_data))
+            ):
+                self._cache.extend(unique_new)
+                self._ids.update(
+                    item.get("id") for item in unique_new if item.get("id")
+                )
+                return
 
             combined_data = existing_data + unique_new
 
-            with open(self.__filename, "w", encoding="utf-8") as f:
-                json.dump(combined_data, f, ensure_ascii=False, indent=4)
+            self._atomic_write(_json_dumps(combined_data))
+
+            self._file_missing = False
+            self._set_cache(combined_data)
 
         except IOError as e:
-            print(f"[ERROR] Запись в файл {self.__filename}: {e}")
+            # Состояние файла неизвестно — сбрасываем кэш
+            self._cache = None
+            self._ids = set()
+            logger.error("[ERROR] Запись в файл %s: %s", self.__filename, e)
+
+    def _atomic_write(self, payload: bytes) -> None:
+        """Атомарно перезаписывает файл: tmp-файл (+fsync) + os.replace.
+
+        Обрыв посреди записи не оставит усеченный JSON — старый файл
+        подменяется новым только целиком. Дисковый барьер fsync
+        включается переменной окружения HH_FSYNC=1.
+        """
+
+        tmp = self.__filename + ".tmp"
+        with open(tmp, "wb", buffering=1 << 20) as f:
+            f.write(payload)
+            if _FSYNC:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, self.__filename)
+
+    def _append_records(self, records: List[Dict[str, Any]], has_existing: bool) -> bool:
+        """Дописывает записи в конец JSON-массива на диске без полной перезаписи.
+
+        Возвращает True при успехе; False — если файл не похож на массив
+        и нужна обычная полная перезапись.
+        """
+
+        inner = _json_dumps(records)[1:-1]
+        try:
+            with open(self.__filename, "r+b") as f:
+                f.seek(0, os.SEEK_END)
+                tail_start = max(0, f.tell() - 16)
+                f.seek(tail_start)
+                tail = f.read()
+                bracket = tail.rfind(b"]")
+                if bracket == -1:
+                    return False
+                # Перезаписываем закрывающую скобку новыми записями
+                f.seek(tail_start + bracket)
+                glue = b"," if has_existing else b""
+                f.write(glue + inner + b"]")
+                f.truncate()
+            return True
+        except IOError:
+            return False
 
     def remove_data(self, condition: Callable[[Dict[str, Any]], bool]) -> None:
         """Удалить данные, удовлетворяющие условию."""
@@ -105,26 +302,40 @@ class JSONFileWorker(AbstractFileWorker):
         data = self.load_data()
         filtered_data = [item for item in data if not condition(item)]
         try:
-            with open(self.__filename, "w", encoding="utf-8") as f:
-                json.dump(filtered_data, f, ensure_ascii=False, indent=4)
+            self._atomic_write(_json_dumps(filtered_data))
+            self._set_cache(filtered_data)
         except IOError as e:
-            print(f"Ошибка удаления данных из {self.__filename}: {e}")
+            # Состояние файла неизвестно — сбрасываем кэш
+            self._cache = None
+            self._ids = set()
+            logger.error("Ошибка удаления данных из %s: %s", self.__filename, e)
 
     def clear_file(self) -> None:
         """Полностью очищает файл, записывая пустой список."""
         try:
-            with open(self.__filename, "w", encoding="utf-8") as f:
-                json.dump([], f, ensure_ascii=False, indent=4)
-            print(f"Файл {self.__filename} успешно очищен!")
+            # Пустой массив известен заранее — сериализатор не нужен
+            with open(self.__filename, "wb") as f:
+                f.write(b"[]")
+            self._file_missing = False
+            self._set_cache([])
+            logger.info("Файл %s успешно очищен!", self.__filename)
         except IOError as e:
-            print(f"Ошибка при очистке файла {self.__filename}: {e}")
+            self._cache = None
+            self._ids = set()
+            logger.error("Ошибка при очистке файла %s: %s", self.__filename, e)
         except Exception as e:
-            print(f"Неожиданная ошибка при очистке: {e}")
+            self._cache = None
+            self._ids = set()
+            logger.error("Неожиданная ошибка при очистке: %s", e)
 
 
 class CSVFileWorker(AbstractFileWorker):
     def __init__(self, filename: str = "data/vacancies.csv"):
         self.__filename = filename  # приватный атрибут
+        # Кэш разобранного файла и множество известных id (как в JSONFileWorker)
+        self._cache: Optional[List[Dict[str, Any]]] = None
+        self._ids: set = set()
+        self._fieldnames: Optional[List[str]] = None  # заголовок файла на диске
         # Создаем директорию, если её нет
         dir_path = os.path.dirname(filename)
         if dir_path and not os.path.exists(dir_path):
@@ -136,41 +347,119 @@ class CSVFileWorker(AbstractFileWorker):
         return self.__filename
 
     def load_data(self) -> List[Dict[str, Any]]:
+        if self._cache is not None:
+            return self._cache
         if not os.path.exists(self.__filename):
+            self._set_cache([])
+            return self._cache
+        try:
+            with open(
+                self.__filename, "r", buffering=1 << 20, newline="", encoding="utf-8"
+            ) as f:
+                reader = csv.reader(f)
+                try:
+                    header = next(reader)
+                except StopIteration:
+                    self._set_cache([])
+                    return self._cache
+                self._fieldnames = header
+                index = {name: i for i, name in enumerate(header)}
+                ncols = len(header)
+                data: List[Dict[str, Any]] = []
+                for row in reader:
+                    if len(row) != ncols:
+                        # Выравниваем неполные/длинные строки под заголовок
+                        row = (row + [None] * ncols)[:ncols]
+                    data.append(_CSVRow(index, tuple(row)))
+            self._set_cache(data)
+            return data
+        except (IOError, csv.Error) as e:
+            logger.error("[ERROR] Чтение CSV файла %s: %s", self.__filename, e)
             return []
+
+    def _scan_ids(self) -> set:
+        """Читает из существующего CSV только колонку id.
+
+        В отличие от load_data, не материализует словари на каждую строку —
+        одного прохода csv.reader достаточно, чтобы построить множество id.
+        """
+
         try:
             with open(self.__filename, "r", newline="", encoding="utf-8") as f:
-                return list(csv.DictReader(f))
+                reader = csv.reader(f)
+                try:
+                    header = next(reader)
+                except StopIteration:
+                    return set()
+                self._fieldnames = header
+                if "id" not in header:
+                    return set()
+                idx = header.index("id")
+                return {row[idx] for row in reader if len(row) > idx and row[idx]}
         except (IOError, csv.Error) as e:
-            print(f"[ERROR] Чтение CSV файла {self.__filename}: {e}")
-            return []
+            logger.error("[ERROR] Чтение CSV файла %s: %s", self.__filename, e)
+            return set()
 
     def save_data(self, data: List[Dict[str, Any]]) -> None:
         """Сохранить данные в CSV-файл (без дублирования по id)."""
         if not data:
             return
 
-        # Проверка: все элементы должны быть словарями
-        for i, item in enumerate(data):
-            if not isinstance(item, dict):
-                print(
-                    f"[ERROR] Запись №{i} не словарь: type={type(item)}, value={repr(item)}"
-                )
-                raise ValueError("Данные для сохранения должны быть словарями")
-
         try:
-            # Загружаем существующие данные
-            if os.path.exists(self.__filename):
-                existing_data = self.load_data()
-                existing_ids = {
-                    item.get("id") for item in existing_data if item.get("id")
-                }
-                unique_new = [
-                    item for item in data if item.get("id") not in existing_ids
-                ]
-                combined_data = existing_data + unique_new
+            # Собираем множество существующих id одним потоковым проходом:
+            # из кэша, если он прогрет, иначе — только колонка id из файла
+            if self._cache is not None:
+                existing_ids = self._ids
+                has_existing = bool(self._cache)
+            elif os.path.exists(self.__filename):
+                existing_ids = self._scan_ids()
+                has_existing = self._fieldnames is not None
             else:
-                combined_data = data
+                existing_ids = set()
+                has_existing = False
+
+            # Один проход по данным: проверка типа и отбор уникальных id сразу
+            seen_ids = set(existing_ids)
+            unique_new: List[Dict[str, Any]] = []
+            append = unique_new.append
+            for i, item in enumerate(data):
+                if not isinstance(item, dict):
+                    logger.debug(
+                        "Запись №%d не словарь: type=%s, value=%r", i, type(item), item
+                    )
+                    raise ValueError("Данные для сохранения должны быть словарями")
+                iid = item.get("id")
+                if iid:
+                    if iid in seen_ids:
+                        continue
+                    seen_ids.add(iid)
+                append(item)
+
+            # Быстрый путь: схема не изменилась — дописываем строки в конец
+            known_fields = set(self._fieldnames) if self._fieldnames else None
+            if (
+                has_existing
+                and known_fields is not None
+                and all(item.keys() <= known_fields for item in unique_new)
+            ):
+                if unique_new:
+                    with open(
+                        self.__filename, "a", newline="", encoding="utf-8"
+                    ) as f:
+                        writer = csv.DictWriter(f, fieldnames=self._fieldnames)
+                        writer.writerows(unique_new)
+                if self._cache is not None:
+                    self._cache.extend(unique_new)
+                    self._ids.update(
+                        item.get("id") for item in unique_new if item.get("id")
+                    )
+                return
+
+            # Полная перезапись: первого сохранения или появились новые поля
+            existing_data = self.load_data()
+            combined_data = (
+                existing_data + unique_new if existing_data else unique_new
+            )
 
             if not combined_data:
                 return
@@ -185,8 +474,11 @@ class CSVFileWorker(AbstractFileWorker):
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
                 writer.writerows(combined_data)
+
+            self._fieldnames = fieldnames
+            self._set_cache(combined_data)
         except (IOError, csv.Error) as e:
-            print(f"Ошибка записи в файл {self.__filename}: {e}")
+            logger.error("Ошибка записи в файл %s: %s", self.__filename, e)
 
     def remove_data(self, condition: Callable[[Dict[str, Any]], bool]) -> None:
         """Удалить данные, удовлетворяющие условию."""
@@ -209,27 +501,29 @@ class CSVFileWorker(AbstractFileWorker):
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
                 writer.writerows(filtered)
+
+            self._set_cache(filtered)
         except (IOError, csv.Error) as e:
-            print(f"Ошибка удаления данных из {self.__filename}: {e}")
+            # Состояние файла неизвестно — сбрасываем кэш
+            self._cache = None
+            self._ids = set()
+            logger.error("Ошибка удаления данных из %s: %s", self.__filename, e)
 
     def clear_file(self) -> None:
         """Полностью очищает CSV-файл, удаляя все строки (кроме заголовка, если есть)."""
         try:
-            if os.path.exists(self.__filename):
-                sample_data = self.load_data()
-                if sample_data and len(sample_data) > 0:
-                    fieldnames = list(sample_data[0].keys())
-                    with open(self.__filename, "w", newline="", encoding="utf-8") as f:
-                        writer = csv.DictWriter(f, fieldnames=fieldnames)
-                        writer.writeheader()
-                else:
-                    # Если файл пустой или не существует, просто создаем пустой файл
-                    with open(self.__filename, "w", newline="", encoding="utf-8") as f:
-                        pass
-            else:
-                # Файл не существует, создаем пустой
-                with open(self.__filename, "w", newline="", encoding="utf-8") as f:
-                    pass
-            print(f"Файл {self.__filename} успешно очищен!")
+            # Заголовок известен из кэша полей — разбирать старый файл незачем;
+            # если кэш холодный, хватает дешевого прохода по колонке id
+            if self._fieldnames is None and os.path.exists(self.__filename):
+                self._scan_ids()
+
+            with open(self.__filename, "w", newline="", encoding="utf-8") as f:
+                if self._fieldnames:
+                    csv.writer(f).writerow(self._fieldnames)
+
+            self._set_cache([])
+            logger.info("Файл %s успешно очищен!", self.__filename)
         except IOError as e:
-            print(f"Ошибка при очистке файла {self.__filename}: {e}")
+            self._cache = None
+            self._ids = set()
+            logger.error("Ошибка при очистке файла %s: %s", self.__filename, e)
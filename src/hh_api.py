@@ -1,11 +1,45 @@
+import logging
 from abc import ABC, abstractmethod
-from typing import List
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
-from src.fileworker import CSVFileWorker, JSONFileWorker
+from src.fileworker import CSVFileWorker, JSONFileWorker, _json_loads
 from src.vacancy import Vacancy
 
+logger = logging.getLogger(__name__)
+
+# С какого суммарного числа записей разбор страниц уходит в пул процессов
+# (на мелких выдачах пул не окупается). Порог заведомо достижим: полная
+# выдача — max_pages=20 страниц по per_page=100 записей, ровно 2000
+_PARALLEL_ITEMS_THRESHOLD = 2000
+
+
+def _build_page(items: List[Any]) -> List[Vacancy]:
+    """Конвертирует сырые записи одной страницы в Vacancy.
+
+    Функция уровня модуля: пригодна для передачи в пул процессов
+    (у связанного метода в замыкании была бы несериализуемая сессия).
+    """
+    page: List[Vacancy] = []
+    for item in items:
+        # Проверка: item должен быть словарем.
+        # Ленивое %-форматирование: при отключенном логгере строка
+        # вообще не собирается и stdout не трогается
+        if not isinstance(item, dict):
+            logger.warning("Пропущена некорректная запись (не словарь): %r", item)
+            continue
+
+        try:
+            # Формат известен на месте вызова — пропускаем его определение
+            page.append(Vacancy.from_hh_api(item))
+        except (ValueError, TypeError, KeyError) as e:
+            logger.warning("Пропущена некорректная вакансия: %s", e)
+            continue
+    return page
+
 
 class Parser(ABC):
     """Абстрактный базовый класс для парсеров вакансий."""
@@ -39,16 +73,47 @@ class HeadHunterAPI(Parser):
             "per_page": 100,
         }  # Оптимизировано: больше вакансий за запрос
         self.__vacancies = []
+        # Кэш условных запросов: (keyword, page) -> (ETag, разобранный JSON).
+        # Ответ 304 Not Modified позволяет не качать и не парсить тело заново
+        self.__etag_cache: Dict[tuple, tuple] = {}
+        # Одна сессия на парсер: keep-alive избавляет от нового
+        # TCP+TLS-рукопожатия на каждую страницу выдачи
+        self.__session = requests.Session()
+        self.__session.headers.update(self.__headers)
+        self.__session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=4,
+                # Экспоненциальный backoff с учетом Retry-After от сервера:
+                # при 429 ждем ровно столько, сколько просит hh.ru,
+                # вместо фиксированных пауз
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    respect_retry_after_header=True,
+                    allowed_methods=["GET"],
+                ),
+            ),
+        )
 
-    def __connect_to_api(self) -> requests.Response:
+    def __connect_to_api(
+        self,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
         """Приватный метод подключения к API. Проверяет статус-код ответа."""
-        response = requests.get(
-            self.__url, headers=self.__headers, params=self.__params, timeout=10
+        response = self.__session.get(
+            self.__url,
+            params=params if params is not None else self.__params,
+            headers=headers,
+            timeout=10,
         )
 
         if response.status_code == 429:  # Too Many Requests
             raise requests.HTTPError("Превышен лимит запросов")
-        elif response.status_code != 200:
+        elif response.status_code not in (200, 304):
             raise requests.HTTPError(
                 f"Не удалось подключиться к API (код: {response.status_code})"
             )
@@ -59,56 +124,123 @@ class HeadHunterAPI(Parser):
         """Подключиться к API и вернуть ответ."""
         return self.__connect_to_api()
 
-    def load_vacancies(self, keyword: str):
-        """Загрузить вакансии по ключевому слову."""
+    def _fetch_page(self, page: int) -> Optional[Dict[str, Any]]:
+        """Загружает одну страницу выдачи и возвращает разобранный JSON.
+
+        Параметры копируются на каждый запрос — метод безопасен для
+        одновременного вызова из нескольких потоков.
+        """
+        params = dict(self.__params)
+        params["page"] = page
+        cache_key = (params.get("text", ""), page)
+        cached = self.__etag_cache.get(cache_key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        try:
+            response = self.__connect_to_api(params, headers)
+            if cached and response.status_code == 304:
+                # Страница не изменилась — отдаем разобранный JSON из кэша
+                return cached[1]
+            # Страница с per_page=100 — ~200 КБ плотного JSON: разбираем
+            # сырые байты orjson-ом (см. fileworker), минуя stdlib-путь
+            # response.json()
+            data = _json_loads(response.content)
+            etag = response.headers.get("ETag")
+            if etag:
+                self.__etag_cache[cache_key] = (etag, data)
+            return data
+        except requests.HTTPError as e:
+            logger.warning("%s", e)
+        except requests.Timeout:
+            logger.warning("Превышено время ожидания ответа от API.")
+        except requests.RequestException as e:
+            logger.warning("Ошибка при загрузке вакансий: %s", e)
+        return None
+
+    # Разбор страницы не зависит от состояния парсера — см. _build_page
+    _build_items = staticmethod(_build_page)
+
+    def load_vacancies(
+        self,
+        keyword: str,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+    ):
+        """Загрузить вакансии по ключевому слову.
+
+        Первая страница запрашивается синхронно, чтобы узнать общее число
+        страниц; остальные качаются параллельно — загрузка ограничена
+        сетевыми ожиданиями, а не CPU.
+
+        limit ограничивает число собираемых вакансий: лишние страницы
+        не запрашиваются вовсе. order_by прокидывается в API hh.ru
+        (например, "salary_desc"), так что топ-K по зарплате не требует
+        выкачивать всю выдачу.
+        """
         self.__params["text"] = keyword
+        if order_by:
+            self.__params["order_by"] = order_by
+        else:
+            self.__params.pop("order_by", None)
         self.__vacancies = []  # Очищаем предыдущие результаты
-        page = 0
         max_pages = 20  # Ограничение для предотвращения чрезмерных запросов
+        max_workers = 5  # Не злоупотребляем лимитами hh.ru
 
-        while page < max_pages:
-            self.__params["page"] = page
-            try:
-                # Используем приватный метод подключения к API
-                response = self.__connect_to_api()
-
-                data = response.json()
-                items = data.get("items", [])
-                if not items:
-                    break
-
-                for item in items:
-                    # Проверка: item должен быть словарем
-                    if not isinstance(item, dict):
-                        print(
-                            f"Пропущена некорректная запись (не словарь): {repr(item)}"
-                        )
-                        continue
-
-                    try:
-                        # Создаем объект Vacancy, который обработает сырые данные
-                        vacancy = Vacancy(item)
-                        self.__vacancies.append(vacancy)
-                    except (ValueError, TypeError, KeyError) as e:
-                        print(f"Пропущена некорректная вакансия: {e}")
-                        continue
-
-                # Проверяем, есть ли еще страницы
-                pages = data.get("pages", 0)
-                if page >= pages - 1:
-                    break
-
-                page += 1
-
-            except requests.HTTPError as e:
-                print(f"{e}")
-                break
-            except requests.Timeout:
-                print("Превышено время ожидания ответа от API.")
-                break
-            except requests.RequestException as e:
-                print(f"Ошибка при загрузке вакансий: {e}")
-                break
+        first = self._fetch_page(0)
+        if not first:
+            return
+
+        items = first.get("items", [])
+        if not items:
+            return
+        page = self._build_items(items)
+
+        pages = min(first.get("pages", 0), max_pages)
+        # Сервер знает общее число совпадений: не запрашиваем страницы,
+        # на которых заведомо ничего нет
+        per_page = self.__params["per_page"]
+        found = first.get("found")
+        if found:
+            pages = min(pages, -(-found // per_page))
+        if limit:
+            if len(page) >= limit:
+                self.__vacancies = page[:limit]
+                return
+            pages = min(pages, -(-limit // per_page))
+        if pages <= 1:
+            self.__vacancies = page
+            return
+
+        # Итоговый размер известен заранее: выделяем список один раз и
+        # заполняем срезами вместо append-а с перевыделениями
+        expected = pages * per_page
+        if found:
+            expected = min(expected, found)
+        vacancies: List[Optional[Vacancy]] = [None] * expected
+        idx = len(page)
+        vacancies[:idx] = page
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self._fetch_page, range(1, pages))
+
+        raw_pages = [data.get("items", []) for data in results if data]
+        total = idx + sum(map(len, raw_pages))
+        if total >= _PARALLEL_ITEMS_THRESHOLD:
+            # Конвертация чисто вычислительная — на крупных выдачах
+            # обходим GIL пулом процессов, страница на задачу
+            with ProcessPoolExecutor() as pool:
+                built_pages = list(pool.map(_build_page, raw_pages))
+        else:
+            built_pages = [self._build_items(raw) for raw in raw_pages]
+
+        for page in built_pages:
+            vacancies[idx:idx + len(page)] = page
+            idx += len(page)
+
+        # Отбрасываем незаполненный хвост (пропущенные записи и недобор)
+        del vacancies[idx:]
+        if limit:
+            del vacancies[limit:]
+        self.__vacancies = vacancies
 
     def get_vacancies(self) -> List[Vacancy]:
         """Вернуть список собранных вакансий."""
@@ -120,7 +252,7 @@ class HeadHunterAPI(Parser):
         Обрабатывает данные через класс Vacancy и сохраняет обработанные данные.
         """
         if not self.__vacancies:
-            print("Нет вакансий для сохранения.")
+            logger.warning("Нет вакансий для сохранения.")
             return
 
         # Преобразуем объекты Vacancy в словари через to_dict()
@@ -143,3 +275,17 @@ class HeadHunterAPI(Parser):
     def clear_vacancies(self) -> None:
         """Очистить список вакансий."""
         self.__vacancies = []
+
+    def _set_vacancies_for_test(self, vacancies: List[Vacancy]) -> None:
+        """Подменяет список вакансий, минуя сетевую загрузку (для тестов)."""
+        self.__vacancies = list(vacancies)
+
+    def close(self) -> None:
+        """Закрыть HTTP-сессию и пул соединений."""
+        self.__session.close()
+
+    def __enter__(self) -> "HeadHunterAPI":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -6,7 +6,31 @@
 """
 
 import re
-from typing import Optional
+import sys
+from typing import List, Optional, Tuple
+
+# Шаблоны компилируются один раз при импорте: функции ниже вызываются
+# по несколько раз на каждую вакансию, и даже поиск в кэше re стоит денег.
+# Разделитель записей \x1e исключен из класса символов: иначе "тег",
+# начавшийся голым "<" в одном тексте склейки, съедал бы разделитель
+# вместе с началом следующего текста
+_HTML_TAG_RE = re.compile(r"<[^>\x1e]+>")
+
+# Допустимые схемы URL: str.startswith с кортежем работает на C-скорости
+# и дешевле даже заранее скомпилированного regex
+_URL_PREFIXES = ("http://", "https://")
+_PROBATION_RE = re.compile(r"(\d+)\s*(месяц|недел|день|год)а?", re.IGNORECASE)
+
+# Заглушка для пустых названий: один интернированный объект на все вакансии
+_NO_TITLE = sys.intern("Вакансия без названия")
+
+# Форма слова для найденной единицы измерения испытательного срока
+_PROBATION_SUFFIX = {
+    "месяц": "месяца",
+    "недел": "недели",
+    "день": "дня",
+    "год": "года",
+}
 
 
 def validate_title(title: str) -> str:
@@ -14,9 +38,11 @@ def validate_title(title: str) -> str:
     Валидирует и очищает название вакансии.
     """
 
-    if not title or not title.strip():
-        return "Вакансия без названия"
-    return title.strip()
+    # Пустые значения отсекаются до strip(), непустые strip-аются один раз
+    if not title:
+        return _NO_TITLE
+    stripped = title.strip()
+    return stripped if stripped else _NO_TITLE
 
 
 def validate_url(url: str) -> str:
@@ -24,10 +50,12 @@ def validate_url(url: str) -> str:
     Валидирует URL вакансии.
     """
 
-    if not url or not url.strip():
+    if not url:
         return ""
     url = url.strip()
-    if not re.match(r"^https?://", url):
+    if not url:
+        return ""
+    if not url.startswith(_URL_PREFIXES):
         raise ValueError(f"Некорректный URL: {url}")
     return url
 
@@ -38,7 +66,41 @@ def clean_html(text: str) -> str:
     """
     if not text:
         return ""
-    return re.sub(r"<[^>]+>", "", text).strip()
+    # Большинство сниппетов hh.ru — чистый текст: проверка "<" на C-скорости
+    # позволяет вообще не запускать regex-движок
+    if "<" not in text:
+        return text.strip()
+    return _HTML_TAG_RE.sub("", text).strip()
+
+
+def clean_html_pair(first: str, second: str) -> Tuple[str, str]:
+    """Удаляет HTML-теги сразу из двух текстов за один проход.
+
+    Тексты склеиваются через разделитель записей (\\x1e), который не
+    встречается в HTML, очищаются одним вызовом regex-движка и
+    разрезаются обратно — вдвое меньше запусков движка на вакансию.
+    """
+    combined = (first or "") + "\x1e" + (second or "")
+    if "<" in combined:
+        combined = _HTML_TAG_RE.sub("", combined)
+    first_clean, _, second_clean = combined.partition("\x1e")
+    return first_clean.strip(), second_clean.strip()
+
+
+def clean_html_batch(texts: List[str]) -> List[str]:
+    """Удаляет HTML-теги из списка текстов за один проход.
+
+    То же, что clean_html_pair, но для целого батча: N текстов чистятся
+    одним вызовом regex-движка вместо N — стоимость его запуска
+    амортизируется по всему батчу.
+    """
+    # Пустой батч: join+split дали бы список из одной пустой строки
+    if not texts:
+        return []
+    joined = "\x1e".join(text or "" for text in texts)
+    if "<" in joined:
+        joined = _HTML_TAG_RE.sub("", joined)
+    return [text.strip() for text in joined.split("\x1e")]
 
 
 def extract_probation_period(text: str) -> Optional[str]:
@@ -48,17 +110,10 @@ def extract_probation_period(text: str) -> Optional[str]:
     Ищет шаблоны вида "3 месяца", "2 недели", "1 день" и т.п.
     """
 
-    pattern = r"(\d+)\s*(месяц|недел|день|год)а?"
-    match = re.search(pattern, text, re.IGNORECASE)
+    match = _PROBATION_RE.search(text)
     if match:
         count = match.group(1)
-        unit = match.group(2)
-        if unit == "месяц":
-            return f"{count} месяца"
-        elif unit == "недел":
-            return f"{count} недели"
-        elif unit == "день":
-            return f"{count} дня"
-        elif unit == "год":
-            return f"{count} года"
+        suffix = _PROBATION_SUFFIX.get(match.group(2))
+        if suffix:
+            return f"{count} {suffix}"
     return None
@@ -1,12 +1,67 @@
 import ast
+import functools
 import json
-from decimal import Decimal
+import operator
+import sys
+from collections.abc import Mapping
 from typing import Any, Dict, Optional
 
-from src.services import (clean_html, extract_probation_period, validate_title,
+from src.services import (clean_html_batch, clean_html_pair,
+                          extract_probation_period, validate_title,
                           validate_url)
 
-
+try:
+    import orjson
+
+    _roles_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson есть в requirements
+    _roles_loads = json.loads
+
+# Нормализация repr-строк ролей к JSON одним C-проходом str.translate
+_QUOTE_TRANS = str.maketrans({"'": '"'})
+
+# Строковые маркеры отсутствующего значения: поиск по frozenset вместо
+# построения кортежа на каждую проверку
+_NULLS = frozenset({"none", "null", ""})
+_NULLS_NAMED = frozenset({"none", "null", "not specified"})
+
+
+def _is_null(val: Any, nulls: frozenset = _NULLS) -> bool:
+    """True для None и строковых маркеров отсутствующего значения."""
+    return val is None or (isinstance(val, str) and val.casefold() in nulls)
+
+
+# Ключ сортировки по средней зарплате: attrgetter читает слот на C-скорости,
+# sorted(vs, key=SALARY_KEY) извлекает ключ один раз на вакансию вместо
+# вызова __lt__ на каждое сравнение
+SALARY_KEY = operator.attrgetter("_avg")
+
+# Порядок ключей сериализации to_dict; кортуж строится один раз на модуль,
+# dict(zip(...)) собирает широкий словарь быстрее литерала с 19 ключами
+_TO_DICT_KEYS = (
+    "id",
+    "title",
+    "url",
+    "employer_name",
+    "employer_url",
+    "salary_from",
+    "salary_to",
+    "currency",
+    "gross",
+    "responsibilities",
+    "requirements",
+    "professional_roles",
+    "experience",
+    "probation_period",
+    "city",
+    "street",
+    "building",
+    "salary_info",
+    "average_salary",
+)
+
+
+@functools.total_ordering
 class Vacancy:
     __slots__ = (
         "id",
@@ -26,25 +81,134 @@ class Vacancy:
         "city",
         "street",
         "building",
+        "_avg",
+        "_salary_info",
+        "_cached_dict",
     )
 
     def __init__(self, data: Dict[str, Any]):
-        """Инициализация из словаря данных вакансии."""
+        """Инициализация из словаря данных вакансии.
+
+        Формат записи (сырой ответ API hh.ru или сохраненная запись файла)
+        определяется один раз по наличию вложенных объектов, дальше работает
+        линейный код соответствующего пути. Если формат известен заранее,
+        дешевле вызывать from_hh_api/from_saved напрямую.
+        """
 
-        if not isinstance(data, dict):
+        # Принимаем и обычные словари, и Mapping-представления строк CSV
+        if not isinstance(data, Mapping):
             raise TypeError(
                 f"Ожидался словарь, получено: {type(data)} (значение: {repr(data)})"
             )
 
+        if self._is_api_format(data):
+            self._fill_from_api(data)
+        else:
+            self._fill_from_saved(data)
+
+    @classmethod
+    def from_hh_api(cls, item: Dict[str, Any]) -> "Vacancy":
+        """Создает Vacancy из сырой записи API hh.ru (вложенные объекты)."""
+
+        if not isinstance(item, Mapping):
+            raise TypeError(
+                f"Ожидался словарь, получено: {type(item)} (значение: {repr(item)})"
+            )
+        vacancy = cls.__new__(cls)
+        vacancy._fill_from_api(item)
+        return vacancy
+
+    @classmethod
+    def from_saved(cls, record: Dict[str, Any]) -> "Vacancy":
+        """Создает Vacancy из сохраненной записи файла (плоские поля)."""
+
+        if not isinstance(record, Mapping):
+            raise TypeError(
+                f"Ожидался словарь, получено: {type(record)} (значение: {repr(record)})"
+            )
+        vacancy = cls.__new__(cls)
+        vacancy._fill_from_saved(record)
+        return vacancy
+
+    @classmethod
+    def from_trusted(cls, record: Dict[str, Any]) -> "Vacancy":
+        """Создает Vacancy из записи нашего же файла без повторной
+        валидации URL — она уже выполнялась перед сохранением."""
+
+        if not isinstance(record, Mapping):
+            raise TypeError(
+                f"Ожидался словарь, получено: {type(record)} (значение: {repr(record)})"
+            )
+        vacancy = cls.__new__(cls)
+        vacancy._fill_from_saved(record, trusted=True)
+        return vacancy
+
+    @classmethod
+    def from_records(cls, records: list) -> list:
+        """Создает вакансии из списка сохраненных записей одним батчем.
+
+        Разобранные professional_roles кэшируются по исходной строке на
+        время батча: повторяющиеся роли парсятся один раз на уникальное
+        значение, а не на каждую запись. Некорректные записи пропускаются.
+        """
+        valid = [record for record in records if isinstance(record, Mapping)]
+
+        # Все сниппеты батча чистятся одним вызовом regex-движка;
+        # порядок: (responsibilities, requirements) на каждую запись
+        texts: list = []
+        for record in valid:
+            resp = record.get("responsibilities")
+            req = record.get("requirements")
+            texts.append(str(resp) if resp else "")
+            texts.append(str(req) if req else "")
+        cleaned = clean_html_batch(texts)
+        # Перестраховка: если батчевая очистка потеряла границы записей,
+        # откатываемся на по-записную очистку внутри _fill_from_saved
+        if len(cleaned) != len(texts):
+            cleaned = None
+
+        role_cache: Dict[str, list] = {}
+        vacancies = []
+        for i, record in enumerate(valid):
+            try:
+                vacancy = cls.__new__(cls)
+                vacancy._fill_from_saved(
+                    record,
+                    role_cache,
+                    (cleaned[2 * i], cleaned[2 * i + 1]) if cleaned else None,
+                    trusted=True,
+                )
+                vacancies.append(vacancy)
+            except (ValueError, TypeError, KeyError):
+                continue
+        return vacancies
+
+    @staticmethod
+    def _is_api_format(data: Dict[str, Any]) -> bool:
+        """Сырую запись API отличает хотя бы один вложенный объект."""
+
+        return (
+            isinstance(data.get("salary"), Mapping)
+            or isinstance(data.get("employer"), Mapping)
+            or isinstance(data.get("snippet"), Mapping)
+            or isinstance(data.get("address"), Mapping)
+        )
+
+    def _fill_scalars(self, data: Dict[str, Any], trusted: bool = False) -> None:
+        """Поля, читающиеся одинаково в обоих форматах: id, название, URL.
+
+        trusted=True пропускает regex-проверку URL: записи из наших же
+        файлов прошли ее перед сохранением, повторять ее на каждой
+        загрузке незачем.
+        """
+
         # ID
         id_val = data.get("id")
         self.id = str(id_val) if id_val is not None else ""
 
         # Название вакансии (может быть в "title" или "name")
         title_val = data.get("title") or data.get("name")
-        if title_val is None or (
-            isinstance(title_val, str) and title_val.lower() in ("none", "null", "")
-        ):
+        if _is_null(title_val):
             title_val = ""
         else:
             title_val = str(title_val).strip()
@@ -52,149 +216,247 @@ class Vacancy:
 
         # URL (может быть в "url" или "alternate_url")
         url_val = data.get("url") or data.get("alternate_url", "")
-        self.url = validate_url(url_val if url_val else "")
+        if trusted:
+            self.url = str(url_val).strip() if url_val else ""
+        else:
+            self.url = validate_url(url_val if url_val else "")
+
+    def _fill_from_api(self, data: Dict[str, Any]) -> None:
+        """Путь для сырой записи API: вложенные объекты читаются напрямую.
+
+        Плоские поля остаются запасным вариантом — встречаются записи,
+        в которых часть объектов отсутствует.
+        """
+
+        self._fill_scalars(data)
 
-        # Работодатель (может быть в "employer_name" или вложенном объекте "employer")
+        # Работодатель
         employer_obj = data.get("employer")
-        if employer_obj and isinstance(employer_obj, dict):
+        if employer_obj and isinstance(employer_obj, Mapping):
             employer_name_val = employer_obj.get("name")
             self.employer_url = employer_obj.get("url")
         else:
             employer_name_val = data.get("employer_name")
             self.employer_url = data.get("employer_url")
+        self.employer_name = self._parse_employer_name(employer_name_val)
 
-        if employer_name_val is None or (
-            isinstance(employer_name_val, str)
-            and employer_name_val.lower() in ("none", "null", "not specified")
-        ):
-            self.employer_name = "Не указано"
-        else:
-            self.employer_name = str(employer_name_val)
-
-        # Зарплата (может быть в плоских полях или вложенном объекте "salary")
+        # Зарплата
         salary_obj = data.get("salary")
-        if salary_obj and isinstance(salary_obj, dict):
+        if salary_obj and isinstance(salary_obj, Mapping):
             salary_from_raw = salary_obj.get("from")
             salary_to_raw = salary_obj.get("to")
             currency_val = salary_obj.get("currency")
-            self.currency = (
-                str(currency_val)
-                if currency_val and str(currency_val).lower() not in ("none", "null")
-                else "RUB"
-            )
             gross_val = salary_obj.get("gross")
-            if gross_val is None:
-                self.gross = True
-            elif isinstance(gross_val, str):
-                self.gross = gross_val.lower().strip() in ("true", "1", "yes", "да")
-            else:
-                self.gross = bool(gross_val)
         else:
-            # Плоские поля (для обратной совместимости)
             salary_from_raw = data.get("salary_from")
             salary_to_raw = data.get("salary_to")
             currency_val = data.get("currency")
-            self.currency = (
-                str(currency_val)
-                if currency_val and str(currency_val).lower() not in ("none", "null")
-                else "RUB"
-            )
             gross_val = data.get("gross")
-            if gross_val is None:
-                self.gross = True
-            elif isinstance(gross_val, str):
-                self.gross = gross_val.lower().strip() in ("true", "1", "yes", "да")
-            else:
-                self.gross = bool(gross_val)
-
-        # Преобразуем зарплату в Decimal при инициализации
+        self.currency = self._parse_currency(currency_val)
+        self.gross = self._parse_gross(gross_val)
         self.salary_from = self._normalize_salary_value(salary_from_raw)
         self.salary_to = self._normalize_salary_value(salary_to_raw)
 
-        # Обязанности и требования (могут быть в плоских полях или вложенном объекте "snippet")
+        # Обязанности и требования
         snippet_obj = data.get("snippet")
-        if snippet_obj and isinstance(snippet_obj, dict):
+        if snippet_obj and isinstance(snippet_obj, Mapping):
             responsibilities_val = snippet_obj.get("responsibility", "")
             requirements_val = snippet_obj.get("requirement", "")
         else:
             responsibilities_val = data.get("responsibilities", "")
             requirements_val = data.get("requirements", "")
+        # Оба текста чистятся одним проходом regex-движка
+        self.responsibilities, self.requirements = clean_html_pair(
+            str(responsibilities_val) if responsibilities_val else "",
+            str(requirements_val) if requirements_val else "",
+        )
+
+        self.professional_roles = self._parse_roles(
+            data.get("professional_roles", [])
+        )
+        self.experience = self._parse_experience(data.get("experience"))
+        self._fill_probation(data)
+
+        # Адрес
+        address_obj = data.get("address")
+        if address_obj and isinstance(address_obj, Mapping):
+            city_val = address_obj.get("city")
+            street_val = address_obj.get("street")
+            building_val = address_obj.get("building")
+        else:
+            city_val = data.get("city")
+            street_val = data.get("street")
+            building_val = data.get("building")
+        self._fill_address(city_val, street_val, building_val)
+
+        self._finalize()
+
+    def _fill_from_saved(
+        self,
+        data: Dict[str, Any],
+        role_cache: Optional[Dict[str, list]] = None,
+        cleaned_texts: Optional[tuple] = None,
+        trusted: bool = False,
+    ) -> None:
+        """Путь для сохраненной записи: только плоские поля, без проверок
+        вложенных объектов — формат файла мы контролируем сами.
+
+        cleaned_texts — пара (responsibilities, requirements), уже
+        очищенная от HTML батчевым проходом (см. from_records).
+        trusted пропускает повторную валидацию URL (см. _fill_scalars).
+        """
+
+        self._fill_scalars(data, trusted)
+
+        self.employer_url = data.get("employer_url")
+        self.employer_name = self._parse_employer_name(data.get("employer_name"))
+
+        self.currency = self._parse_currency(data.get("currency"))
+        self.gross = self._parse_gross(data.get("gross"))
+        self.salary_from = self._normalize_salary_value(data.get("salary_from"))
+        self.salary_to = self._normalize_salary_value(data.get("salary_to"))
+
+        if cleaned_texts is not None:
+            self.responsibilities, self.requirements = cleaned_texts
+        else:
+            responsibilities_val = data.get("responsibilities", "")
+            requirements_val = data.get("requirements", "")
+            # Оба текста чистятся одним проходом regex-движка
+            self.responsibilities, self.requirements = clean_html_pair(
+                str(responsibilities_val) if responsibilities_val else "",
+                str(requirements_val) if requirements_val else "",
+            )
 
-        self.responsibilities = clean_html(
-            str(responsibilities_val) if responsibilities_val else ""
+        self.professional_roles = self._parse_roles(
+            data.get("professional_roles", []), role_cache
         )
-        self.requirements = clean_html(
-            str(requirements_val) if requirements_val else ""
+        self.experience = self._parse_experience(data.get("experience"))
+        self._fill_probation(data)
+        self._fill_address(
+            data.get("city"), data.get("street"), data.get("building")
         )
 
-        # Профессиональные роли
-        # Формат: список строк вида "{'id': '156', 'name': 'BI Analyst, Data Analyst'}"
-        # или строка вида "['Разработчик', 'Backend']"
-        roles = data.get("professional_roles", [])
-        self.professional_roles = []
+        self._finalize()
+
+    @staticmethod
+    def _parse_employer_name(employer_name_val: Any) -> str:
+        """Нормализует имя работодателя.
+
+        Значение интернируется: работодатели повторяются между вакансиями,
+        и sys.intern сводит дубликаты к одному объекту str.
+        """
+
+        if _is_null(employer_name_val, _NULLS_NAMED):
+            return "Не указано"
+        return sys.intern(str(employer_name_val))
+
+    @staticmethod
+    def _parse_currency(currency_val: Any) -> str:
+        """Нормализует валюту (по умолчанию RUB); значение интернируется."""
+
+        return (
+            sys.intern(str(currency_val))
+            if currency_val and not _is_null(currency_val)
+            else "RUB"
+        )
+
+    @staticmethod
+    def _parse_gross(gross_val: Any) -> bool:
+        """Нормализует признак gross/net."""
+
+        if gross_val is None:
+            return True
+        if isinstance(gross_val, str):
+            return gross_val.lower().strip() in ("true", "1", "yes", "да")
+        return bool(gross_val)
+
+    @staticmethod
+    def _parse_roles(
+        roles: Any, role_cache: Optional[Dict[str, list]] = None
+    ) -> list:
+        """Разбирает профессиональные роли.
+
+        Формат: список словарей API, список строк вида
+        "{\'id\': \'156\', \'name\': ...}" или строка вида "[\'Разработчик\']".
+        role_cache (если передан) переиспользует результат разбора для
+        повторяющихся исходных строк в пределах батча.
+        """
+
+        cache_key = roles if isinstance(roles, str) else None
+        if role_cache is not None and cache_key is not None:
+            cached = role_cache.get(cache_key)
+            if cached is not None:
+                # Копия: professional_roles — изменяемый список экземпляра
+                return list(cached)
+
+        parsed = []
         if isinstance(roles, str):
-            # Если roles это строка, пытаемся распарсить как список
+            # Сохраненные записи содержат JSON: C-парсер на порядок быстрее
+            # ast.literal_eval, который токенизирует строку как Python-код
             try:
-                roles = ast.literal_eval(roles)
-            except (ValueError, SyntaxError):
-                roles = []
+                roles = _roles_loads(roles)
+            except (ValueError, TypeError):
+                # Легаси-формат: repr-строка с одинарными кавычками
+                try:
+                    roles = ast.literal_eval(roles)
+                except (ValueError, SyntaxError):
+                    roles = []
 
         if roles and isinstance(roles, list):
             for role in roles:
                 if isinstance(role, str):
-                    # Пытаемся распарсить строку как словарь
+                    # Пытаемся распарсить строку как словарь: сначала JSON
+                    # (после нормализации кавычек), ast — только когда строка
+                    # явно содержит питоновские литералы, непосильные JSON
                     try:
-                        # Заменяем одинарные кавычки на двойные для JSON
-                        role_str = role.replace("'", '"')
+                        # Без одинарных кавычек строка уже валидный JSON —
+                        # не копируем ее через translate
+                        role_str = (
+                            role if "'" not in role else role.translate(_QUOTE_TRANS)
+                        )
                         role_dict = json.loads(role_str)
-                        if isinstance(role_dict, dict) and "name" in role_dict:
-                            self.professional_roles.append(role_dict["name"])
-                        else:
-                            self.professional_roles.append(role)
-                    except (json.JSONDecodeError, ValueError, SyntaxError):
-                        # Если не получилось распарсить, пытаемся через ast.literal_eval
-                        try:
-                            role_dict = ast.literal_eval(role)
-                            if isinstance(role_dict, dict) and "name" in role_dict:
-                                self.professional_roles.append(role_dict["name"])
-                            else:
-                                self.professional_roles.append(role)
-                        except (ValueError, SyntaxError):
-                            # Если всё равно не получилось, используем строку как есть
-                            self.professional_roles.append(role)
+                    except ValueError:
+                        role_dict = None
+                        if "(" in role or "None" in role:
+                            try:
+                                role_dict = ast.literal_eval(role)
+                            except (ValueError, SyntaxError):
+                                role_dict = None
+                    if isinstance(role_dict, dict) and "name" in role_dict:
+                        parsed.append(role_dict["name"])
+                    else:
+                        # Не словарь с именем — используем строку как есть
+                        parsed.append(role)
                 elif isinstance(role, dict):
                     # Если это уже словарь
                     if "name" in role:
-                        self.professional_roles.append(role["name"])
+                        parsed.append(role["name"])
                     else:
-                        self.professional_roles.append(str(role))
+                        parsed.append(str(role))
                 else:
-                    self.professional_roles.append(str(role))
-
-        # Опыт работы
-        # Формат: словарь с ключами "id" и "name"
-        experience_val = data.get("experience")
-        if experience_val is None:
-            self.experience = "Не указан"
-        elif isinstance(experience_val, dict):
-            self.experience = experience_val.get("name", "Не указан")
-        elif isinstance(experience_val, str):
-            # Если это строка, проверяем валидность
-            if experience_val.lower() in ("none", "null"):
-                self.experience = "Не указан"
-            else:
-                # Если это не валидная строка (например, "not a dict"), считаем невалидным
-                self.experience = "Не указан"
-        else:
-            # Если experience не словарь и не None, считаем его невалидным
-            self.experience = "Не указан"
+                    parsed.append(str(role))
+
+        if role_cache is not None and cache_key is not None:
+            role_cache[cache_key] = parsed
+            return list(parsed)
+        return parsed
+
+    @staticmethod
+    def _parse_experience(experience_val: Any) -> str:
+        """Нормализует опыт работы (словарь API или строка)."""
+
+        if isinstance(experience_val, dict):
+            name = experience_val.get("name")
+            # В API всего несколько градаций опыта — интернируем
+            return sys.intern(str(name)) if name else "Не указан"
+        # None, невалидные строки и прочие типы считаем неуказанным опытом
+        return "Не указан"
+
+    def _fill_probation(self, data: Dict[str, Any]) -> None:
+        """Испытательный срок: явное поле или извлечение из описания."""
 
-        # Испытательный срок
         probation_val = data.get("probation_period")
-        if probation_val is None or (
-            isinstance(probation_val, str)
-            and probation_val.lower() in ("none", "null", "")
-        ):
+        if _is_null(probation_val):
             # Пытаемся извлечь из описания
             self.probation_period = extract_probation_period(
                 self.responsibilities + " " + self.requirements
@@ -202,144 +464,133 @@ class Vacancy:
         else:
             self.probation_period = str(probation_val)
 
-        # Адрес (может быть в плоских полях или вложенном объекте "address")
-        address_obj = data.get("address")
-        if address_obj and isinstance(address_obj, dict):
-            city_val = address_obj.get("city")
-            street_val = address_obj.get("street")
-            building_val = address_obj.get("building")
-        else:
-            city_val = data.get("city")
-            street_val = data.get("street")
-            building_val = data.get("building")
+    def _fill_address(self, city_val: Any, street_val: Any, building_val: Any) -> None:
+        """Нормализует адресные поля."""
 
-        if city_val is None or (
-            isinstance(city_val, str)
-            and city_val.lower() in ("none", "null", "not specified")
-        ):
+        if _is_null(city_val, _NULLS_NAMED):
             self.city = "Не указан"
         else:
-            self.city = str(city_val)
+            # Городов в выдаче немного — интернируем повторяющиеся значения
+            self.city = sys.intern(str(city_val))
 
         self.street = (
-            str(street_val)
-            if street_val and str(street_val).lower() not in ("none", "null")
-            else ""
+            str(street_val) if street_val and not _is_null(street_val) else ""
         )
         self.building = (
-            str(building_val)
-            if building_val and str(building_val).lower() not in ("none", "null")
-            else ""
+            str(building_val) if building_val and not _is_null(building_val) else ""
         )
 
-    def _normalize_salary_value(self, salary_val) -> Optional[Decimal]:
-        """Нормализует значение зарплаты: преобразует в Decimal или возвращает None."""
+    def _finalize(self) -> None:
+        """Кэширует производные значения после заполнения полей.
+
+        Средняя зарплата считается один раз: сортировки и сравнения дальше
+        обходятся только сравнением готовых int.
+        """
+
+        self._avg = (
+            (self.salary_from + self.salary_to) // 2
+            if (self.salary_from or self.salary_to)
+            else 0
+        )
+        # Строка зарплаты и словарь to_dict строятся лениво при первом
+        # обращении (cached_property несовместим со __slots__,
+        # кэшируем вручную)
+        self._salary_info = None
+        self._cached_dict = None
+
+    @staticmethod
+    def _normalize_salary_value(salary_val) -> int:
+        """Нормализует значение зарплаты: приводит к int, некорректные — 0.
+
+        Хранение в int вместо Decimal убирает самый дорогой численный путь
+        CPython из горячего цикла создания вакансий; копейки здесь не нужны.
+        """
         if salary_val is None:
-            return Decimal("0")
+            return 0
         if isinstance(salary_val, (int, float)):
-            return Decimal(
-                str(int(salary_val))
-            )  # Преобразуем float в int, затем в Decimal
+            return int(salary_val)
         if isinstance(salary_val, str):
             salary_str = salary_val.strip()
-            if salary_str in ("none", "null", ""):
-                return Decimal("0")
+            if salary_str in _NULLS:
+                return 0
             try:
                 # Пытаемся преобразовать строку в число
-                num_val = float(salary_str)
-                return Decimal(str(int(num_val)))
+                return int(float(salary_str))
             except (ValueError, TypeError):
-                return Decimal("0")
+                return 0
         try:
-            return Decimal(str(int(salary_val)))
+            return int(salary_val)
         except (ValueError, TypeError):
-            return Decimal("0")
-
-    def _get_numeric_salary(self, salary_val) -> Decimal:
-        """Преобразует значение зарплаты в Decimal для вычислений."""
-        if salary_val is None:
-            return Decimal("0")
-        if isinstance(salary_val, (int, float)):
-            return Decimal(str(salary_val))
-        if isinstance(salary_val, str):
-            salary_str = salary_val.strip().lower()
-            if salary_str in ("none", "null", ""):
-                return Decimal("0")
-            try:
-                return Decimal(salary_str)
-            except (ValueError, TypeError):
-                return Decimal("0")
-        try:
-            return Decimal(str(salary_val))
-        except (ValueError, TypeError):
-            return Decimal("0")
+            return 0
 
     @property
     def salary_info(self) -> str:
-        """Возвращает строковое представление зарплаты."""
-        salary_from_num = self._get_numeric_salary(self.salary_from)
-        salary_to_num = self._get_numeric_salary(self.salary_to)
-
-        # Если оба значения равны 0 или None, зарплата не указана
-        if salary_from_num == Decimal("0") and salary_to_num == Decimal("0"):
+        """Возвращает строковое представление зарплаты (кэшируется)."""
+        cached = self._salary_info
+        if cached is None:
+            cached = self._format_salary_info()
+            self._salary_info = cached
+        return cached
+
+    def _format_salary_info(self) -> str:
+        """Форматирует строку зарплаты; вызывается один раз на вакансию.
+
+        Суммы — int, поэтому спецификатор \",d\" идет по целочисленному
+        C-пути форматирования, минуя дорогое float-представление \",.0f\".
+        """
+        salary_from_num = self.salary_from
+        salary_to_num = self.salary_to
+
+        if not (salary_from_num or salary_to_num):
             return "Зарплата не указана"
 
-        # Если from и to равны, показываем одну сумму
-        if salary_from_num == salary_to_num and salary_from_num > 0:
-            amount = f"{salary_from_num:,.0f}"
-            return f"{amount} {self.currency} ({'gross' if self.gross else 'net'})"
-        else:
-            from_amount = f"{salary_from_num:,.0f}" if salary_from_num > 0 else None
-            to_amount = f"{salary_to_num:,.0f}" if salary_to_num > 0 else None
-
-            if from_amount and to_amount:
-                return f"от {from_amount} до {to_amount} {self.currency} ({'gross' if self.gross else 'net'})"
-            elif from_amount:
-                return f"от {from_amount} {self.currency} ({'gross' if self.gross else 'net'})"
-            elif to_amount:
-                return f"до {to_amount} {self.currency} ({'gross' if self.gross else 'net'})"
-            else:
-                return "зарплата не указана"
-
-    def average_salary(self) -> Decimal:
-        """Вычисляет среднюю зарплату."""
-        salary_from_num = self._get_numeric_salary(self.salary_from)
-        salary_to_num = self._get_numeric_salary(self.salary_to)
-
-        if salary_from_num == Decimal("0") and salary_to_num == Decimal("0"):
-            return Decimal("0")
-        return (salary_from_num + salary_to_num) / 2
+        kind = "gross" if self.gross else "net"
+        # После проверки выше равные границы означают одну положительную сумму
+        if salary_from_num == salary_to_num:
+            return f"{salary_from_num:,d} {self.currency} ({kind})"
+        if salary_from_num and salary_to_num:
+            return (
+                f"от {salary_from_num:,d} до {salary_to_num:,d} "
+                f"{self.currency} ({kind})"
+            )
+        if salary_from_num:
+            return f"от {salary_from_num:,d} {self.currency} ({kind})"
+        return f"до {salary_to_num:,d} {self.currency} ({kind})"
 
-    def __eq__(self, other) -> bool:
-        if not isinstance(other, Vacancy):
-            return NotImplemented
-        return self.average_salary() == other.average_salary()
+    def average_salary(self) -> int:
+        """Возвращает среднюю зарплату (посчитана при инициализации)."""
+        return self._avg
 
-    def __lt__(self, other) -> bool:
+    def __eq__(self, other) -> bool:
         if not isinstance(other, Vacancy):
             return NotImplemented
-        return self.average_salary() < other.average_salary()
+        return self._avg == other._avg
 
-    def __le__(self, other) -> bool:
-        if not isinstance(other, Vacancy):
-            return NotImplemented
-        return self.average_salary() <= other.average_salary()
+    def __hash__(self) -> int:
+        # Хэш согласован с __eq__ (по средней зарплате): равные объекты
+        # обязаны давать равный хэш, иначе set/dict ведут себя неверно.
+        # Для дедупликации по идентичности вакансии используйте
+        # same_vacancy или ключ v.id
+        return hash(self._avg)
 
-    def __gt__(self, other) -> bool:
-        if not isinstance(other, Vacancy):
-            return NotImplemented
-        return self.average_salary() > other.average_salary()
+    @staticmethod
+    def same_vacancy(first: "Vacancy", second: "Vacancy") -> bool:
+        """Одна и та же вакансия hh.ru (по id), независимо от зарплат."""
+        return first.id == second.id
 
-    def __ge__(self, other) -> bool:
+    # Остальные сравнения (__le__/__gt__/__ge__) выводит total_ordering
+    def __lt__(self, other) -> bool:
         if not isinstance(other, Vacancy):
             return NotImplemented
-        return self.average_salary() >= other.average_salary()
+        return self._avg < other._avg
 
     def __str__(self) -> str:
-        salary_part = self.salary_info
+        # Кортеж вместо списка и генератор вместо filter: без лишних
+        # аллокаций на каждый вывод; salary_info уже закэширован
         city_part = self.city if self.city != "Не указан" else ""
-        parts = [self.title, salary_part, city_part]
-        return " | ".join(filter(None, parts))
+        return " | ".join(
+            part for part in (self.title, self.salary_info, city_part) if part
+        )
 
     def __repr__(self) -> str:
         return (
@@ -350,38 +601,38 @@ class Vacancy:
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        # Преобразуем Decimal зарплату в int или None (если 0)
-        salary_from_dict = (
-            int(self.salary_from) if self.salary_from != Decimal("0") else None
+        # Поля после __init__ не меняются, поэтому словарь строится один
+        # раз и переиспользуется при повторных сериализациях
+        if self._cached_dict is not None:
+            return self._cached_dict
+
+        # Нулевые зарплаты и среднее в файле хранятся как None;
+        # title гарантирован validate_title при заполнении полей
+        data = dict(
+            zip(
+                _TO_DICT_KEYS,
+                (
+                    self.id,
+                    self.title,
+                    self.url,
+                    self.employer_name,
+                    self.employer_url,
+                    self.salary_from or None,
+                    self.salary_to or None,
+                    self.currency,
+                    self.gross,
+                    self.responsibilities,
+                    self.requirements,
+                    self.professional_roles,
+                    self.experience,
+                    self.probation_period,
+                    self.city,
+                    self.street,
+                    self.building,
+                    self.salary_info,
+                    self._avg or None,
+                ),
+            )
         )
-        salary_to_dict = int(self.salary_to) if self.salary_to != Decimal("0") else None
-
-        data = {
-            "id": self.id,
-            "title": self.title,
-            "url": self.url,
-            "employer_name": self.employer_name,
-            "employer_url": self.employer_url,
-            "salary_from": salary_from_dict,
-            "salary_to": salary_to_dict,
-            "currency": self.currency,
-            "gross": self.gross,
-            "responsibilities": self.responsibilities,
-            "requirements": self.requirements,
-            "professional_roles": self.professional_roles,
-            "experience": self.experience,
-            "probation_period": self.probation_period,
-            "city": self.city,
-            "street": self.street,
-            "building": self.building,
-            "salary_info": self.salary_info,
-            "average_salary": (
-                int(self.average_salary())
-                if self.average_salary() != Decimal("0")
-                else None
-            ),
-        }
-        assert isinstance(data, dict), f"to_dict() вернул не словарь: {type(data)}"
-        if not data["title"] or data["title"] == "Вакансия без названия":
-            data["title"] = "Вакансия без названия"
+        self._cached_dict = data
         return data
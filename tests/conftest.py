@@ -0,0 +1,81 @@
+"""
+Общие фикстуры и вспомогательные классы тестового пакета.
+
+Вынесены в conftest.py: pytest загружает их один раз на сессию, а тестовые
+модули не дублируют определения.
+"""
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.fileworker import JSONFileWorker
+from src.hh_api import HeadHunterAPI
+
+
+class _Resp:
+    """Легковесная замена MagicMock для HTTP-ответов.
+
+    Экземпляр — три готовых атрибута вместо спецификации MagicMock на
+    каждый тест; тело сериализуется один раз при создании константы.
+    """
+
+    __slots__ = ("status_code", "content", "headers")
+
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self.content = b"" if payload is None else json.dumps(payload).encode()
+        self.headers = {}
+
+
+# Канонические записи для тестов Vacancy: кейсы клонируют базу и меняют
+# только отличающиеся поля вместо полного литерала в каждом тесте
+BASE_RAW = {"id": "123", "name": "Dev", "alternate_url": "https://hh.ru/vacancy/123"}
+BASE_SAVED = {"id": "123", "title": "Dev", "url": "https://hh.ru/vacancy/123"}
+
+
+def make_raw(**overrides):
+    """Строит сырую запись API на основе BASE_RAW с переопределениями."""
+    record = BASE_RAW.copy()
+    record.update(overrides)
+    return record
+
+
+def make_saved(**overrides):
+    """Строит сохраненную запись на основе BASE_SAVED с переопределениями."""
+    record = BASE_SAVED.copy()
+    record.update(overrides)
+    return record
+
+
+@pytest.fixture(scope="module")
+def hh_file(tmp_path_factory):
+    """Путь к тестовому JSON-файлу во временной директории pytest.
+
+    tmp_path убирает и per-test зачистку (stat+unlink на каждый тест),
+    и следы в рабочей директории — pytest удаляет все скопом.
+    """
+    return str(tmp_path_factory.mktemp("hh_api") / "hh_test.json")
+
+
+@pytest.fixture(scope="module")
+def hh_parser(hh_file):
+    """Создаёт экземпляр HeadHunterAPI с тестовым JSONFileWorker.
+
+    Один парсер на модуль: создание парсера и file_worker не повторяется
+    в каждом тесте, состояние сбрасывается фикстурой _reset_parser.
+    """
+    file_worker = JSONFileWorker(hh_file)
+    return HeadHunterAPI(file_worker)
+
+
+@pytest.fixture(autouse=True)
+def mock_get(monkeypatch):
+    """Единая подмена requests.Session.get.
+
+    autouse на весь пакет: ни один тест не уходит в сеть; тесты, которым
+    нужен ответ, запрашивают фикстуру и задают return_value/side_effect.
+    """
+    mocked = MagicMock()
+    monkeypatch.setattr("requests.Session.get", mocked)
+    return mocked
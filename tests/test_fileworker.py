@@ -8,60 +8,45 @@ import pytest
 from src.fileworker import CSVFileWorker, JSONFileWorker
 
 
-@pytest.fixture(autouse=True)
-def cleanup_test_files():
-    """Очистка тестовых файлов после выполнения тестов."""
-    test_files = [
-        "data/test_vacancies.json",
-        "data/test_vacancies.csv",
-        "data/test_vacancies_empty.json",
-        "data/test_vacancies_corrupted.json",
-        "dummy.json",  # Тестовый файл из test_json_remove_duplicates_private_method
-    ]
-    for f in test_files:
-        if os.path.exists(f):
-            os.remove(f)
-
-
-def test_json_load_data_file_not_exists():
+def test_json_load_data_file_not_exists(tmp_path):
     """Проверка загрузки из несуществующего JSON‑файла."""
-    worker = JSONFileWorker("data/nonexistent.json")
+    worker = JSONFileWorker(str(tmp_path / "nonexistent.json"))
     data = worker.load_data()
     assert data == []
 
 
-def test_json_load_data_empty_file():
+def test_json_load_data_empty_file(tmp_path):
     """Проверка загрузки пустого JSON‑файла."""
-    with open("data/test_vacancies_empty.json", "w", encoding="utf-8") as f:
-        f.write("")
-    worker = JSONFileWorker("data/test_vacancies_empty.json")
+    path = tmp_path / "empty.json"
+    path.write_text("", encoding="utf-8")
+    worker = JSONFileWorker(str(path))
     data = worker.load_data()
     assert data == []
 
 
-def test_json_load_data_corrupted_json():
+def test_json_load_data_corrupted_json(tmp_path):
     """Проверка загрузки некорректного JSON‑файла."""
-    with open("data/test_vacancies_corrupted.json", "w", encoding="utf-8") as f:
-        f.write("{invalid json}")
-    worker = JSONFileWorker("data/test_vacancies_corrupted.json")
+    path = tmp_path / "corrupted.json"
+    path.write_text("{invalid json}", encoding="utf-8")
+    worker = JSONFileWorker(str(path))
     data = worker.load_data()
     assert data == []
 
 
-def test_json_save_data_new_file():
+def test_json_save_data_new_file(tmp_path):
     """Проверка сохранения данных в новый JSON‑файл."""
-    worker = JSONFileWorker("data/test_vacancies.json")
+    path = tmp_path / "vacancies.json"
+    worker = JSONFileWorker(str(path))
     worker.save_data([{"id": "1", "title": "New Job"}])
 
-    with open("data/test_vacancies.json", "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = json.loads(path.read_text(encoding="utf-8"))
     assert len(data) == 1
     assert data[0]["title"] == "New Job"
 
 
-def test_json_save_data_no_duplicates():
+def test_json_save_data_no_duplicates(tmp_path):
     """Проверка отсутствия дубликатов при сохранении в JSON."""
-    worker = JSONFileWorker("data/test_vacancies.json")
+    worker = JSONFileWorker(str(tmp_path / "vacancies.json"))
     worker.save_data([{"id": "1", "title": "Job 1"}])
     worker.save_data([{"id": "1", "title": "Duplicate"}])
 
@@ -70,9 +55,9 @@ def test_json_save_data_no_duplicates():
     assert data[0]["title"] == "Job 1"
 
 
-def test_json_remove_data():
+def test_json_remove_data(tmp_path):
     """Проверка удаления данных из JSON‑файла по условию."""
-    worker = JSONFileWorker("data/test_vacancies.json")
+    worker = JSONFileWorker(str(tmp_path / "vacancies.json"))
     worker.save_data(
         [
             {"id": "1", "title": "Keep"},
@@ -85,18 +70,18 @@ def test_json_remove_data():
     assert data[0]["title"] == "Keep"
 
 
-def test_json_clear_file():
+def test_json_clear_file(tmp_path):
     """Проверка очистки JSON‑файла."""
-    worker = JSONFileWorker("data/test_vacancies.json")
+    worker = JSONFileWorker(str(tmp_path / "vacancies.json"))
     worker.save_data([{"id": "1", "title": "Test"}])
     worker.clear_file()
     data = worker.load_data()
     assert data == []
 
 
-def test_json_remove_duplicates_private_method():
+def test_json_remove_duplicates_private_method(tmp_path):
     """Проверка отсутствия дубликатов при сохранении (метод удален, но функциональность работает через save_data)."""
-    worker = JSONFileWorker("dummy.json")
+    worker = JSONFileWorker(str(tmp_path / "dummy.json"))
     existing = [{"id": "1", "title": "Existing"}]
     new = [{"id": "1", "title": "New"}, {"id": "2", "title": "Unique"}]
     # Тестируем функциональность через save_data
@@ -108,19 +93,20 @@ def test_json_remove_duplicates_private_method():
     assert result[1]["id"] == "2"
 
 
-def test_csv_load_data_file_not_exists():
+def test_csv_load_data_file_not_exists(tmp_path):
     """Проверка загрузки из несуществующего CSV‑файла."""
-    worker = CSVFileWorker("data/nonexistent.csv")
+    worker = CSVFileWorker(str(tmp_path / "nonexistent.csv"))
     data = worker.load_data()
     assert data == []
 
 
-def test_csv_save_data_new_file():
+def test_csv_save_data_new_file(tmp_path):
     """Проверка сохранения данных в новый CSV‑файл."""
-    worker = CSVFileWorker("data/test_vacancies.csv")
+    path = tmp_path / "vacancies.csv"
+    worker = CSVFileWorker(str(path))
     worker.save_data([{"id": "1", "title": "CSV Job", "salary": "100000"}])
 
-    with open("data/test_vacancies.csv", "r", newline="", encoding="utf-8") as f:
+    with open(path, "r", newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         data = list(reader)
     assert len(data) == 1
@@ -128,9 +114,24 @@ def test_csv_save_data_new_file():
     assert data[0]["salary"] == "100000"
 
 
-def test_csv_remove_data():
+def test_csv_save_data_duplicates_in_batch_new_file(tmp_path):
+    """Проверка дедупликации по id внутри одной партии в новом CSV‑файле."""
+    worker = CSVFileWorker(str(tmp_path / "fresh.csv"))
+    worker.save_data(
+        [
+            {"id": "1", "title": "First"},
+            {"id": "1", "title": "Duplicate"},
+            {"id": "2", "title": "Second"},
+        ]
+    )
+    data = worker.load_data()
+    assert len(data) == 2
+    assert data[0]["title"] == "First"
+
+
+def test_csv_remove_data(tmp_path):
     """Проверка удаления данных из CSV‑файла по условию."""
-    worker = CSVFileWorker("data/test_vacancies.csv")
+    worker = CSVFileWorker(str(tmp_path / "vacancies.csv"))
     worker.save_data(
         [
             {"id": "1", "title": "Keep"},
@@ -144,78 +145,72 @@ def test_csv_remove_data():
     assert data[0]["title"] == "Keep"
 
 
-def test_csv_clear_file_with_data():
+def test_csv_clear_file_with_data(tmp_path):
     """Проверка очистки CSV‑файла с данными."""
-    worker = CSVFileWorker("data/test_vacancies.csv")
+    worker = CSVFileWorker(str(tmp_path / "vacancies.csv"))
     worker.save_data([{"id": "1", "title": "Test"}])
     worker.clear_file()
     data = worker.load_data()
     assert data == []
 
 
-def test_csv_clear_file_empty():
+def test_csv_clear_file_empty(tmp_path):
     """Проверка очистки пустого CSV‑файла."""
-    worker = CSVFileWorker("data/test_vacancies.csv")
+    path = tmp_path / "vacancies.csv"
+    worker = CSVFileWorker(str(path))
     worker.clear_file()
-    assert os.path.exists("data/test_vacancies.csv")
+    assert os.path.exists(path)
 
 
 @patch("builtins.open", side_effect=IOError("Disk error"))
-def test_json_save_data_io_error(mock_open, capsys):
+def test_json_save_data_io_error(mock_open, tmp_path, caplog):
     """Проверка ошибки записи в JSON‑файл."""
-    worker = JSONFileWorker("data/test.json")
+    worker = JSONFileWorker(str(tmp_path / "io_error.json"))
     worker.save_data([{"id": "1"}])
-    captured = capsys.readouterr()
-    assert "[ERROR] Запись в файл data/test.json: Disk error" in captured.out
+    assert f"[ERROR] Запись в файл {worker.filename}: Disk error" in caplog.text
 
 
 @patch("builtins.open", side_effect=IOError("Disk error"))
-def test_json_clear_file_io_error(mock_open, capsys):
+def test_json_clear_file_io_error(mock_open, tmp_path, caplog):
     """Проверка ошибки при очистке JSON‑файла."""
-    worker = JSONFileWorker("data/test.json")
+    worker = JSONFileWorker(str(tmp_path / "io_error.json"))
     worker.clear_file()
-    captured = capsys.readouterr()
-    assert "Ошибка при очистке файла data/test.json: Disk error" in captured.out
+    assert f"Ошибка при очистке файла {worker.filename}: Disk error" in caplog.text
 
 
 @patch("builtins.open", side_effect=IOError("Disk error"))
-def test_csv_save_data_io_error(mock_open, capsys):
+def test_csv_save_data_io_error(mock_open, tmp_path, caplog):
     """Проверка ошибки записи в CSV‑файл."""
-    worker = CSVFileWorker("data/test.csv")
+    worker = CSVFileWorker(str(tmp_path / "io_error.csv"))
     worker.save_data([{"id": "1"}])
-    captured = capsys.readouterr()
-    assert "Ошибка записи в файл data/test.csv: Disk error" in captured.out
+    assert f"Ошибка записи в файл {worker.filename}: Disk error" in caplog.text
 
 
 @patch("builtins.open", side_effect=IOError("Disk error"))
-def test_csv_clear_file_io_error(mock_open, capsys):
+def test_csv_clear_file_io_error(mock_open, tmp_path, caplog):
     """Проверка ошибки при очистке CSV‑файла."""
-    worker = CSVFileWorker("data/test.csv")
+    worker = CSVFileWorker(str(tmp_path / "io_error.csv"))
     worker.clear_file()
-    captured = capsys.readouterr()
-    assert "Ошибка при очистке файла data/test.csv: Disk error" in captured.out
+    assert f"Ошибка при очистке файла {worker.filename}: Disk error" in caplog.text
 
 
-def test_json_save_data_with_non_dict():
+def test_json_save_data_with_non_dict(tmp_path):
     """Проверка ошибки при сохранении не-словаря."""
-    worker = JSONFileWorker("data/test.json")
+    worker = JSONFileWorker(str(tmp_path / "non_dict.json"))
     with pytest.raises(ValueError, match="Данные для сохранения должны быть словарями"):
         worker.save_data([{"id": "1"}, "not a dict", {"id": "2"}])
 
 
-def test_csv_save_data_with_non_dict():
+def test_csv_save_data_with_non_dict(tmp_path):
     """Проверка ошибки при сохранении не-словаря в CSV."""
-    worker = CSVFileWorker("data/test.csv")
+    worker = CSVFileWorker(str(tmp_path / "non_dict.csv"))
     with pytest.raises(ValueError, match="Данные для сохранения должны быть словарями"):
         worker.save_data([{"id": "1"}, "not a dict", {"id": "2"}])
 
 
-def test_json_save_data_empty_list():
+def test_json_save_data_empty_list(tmp_path):
     """Проверка сохранения пустого списка в JSON."""
-    worker = JSONFileWorker("data/test_empty.json")
-    # Если файл существует, очищаем его
-    if os.path.exists(worker.filename):
-        worker.clear_file()
+    worker = JSONFileWorker(str(tmp_path / "empty_list.json"))
     worker.save_data([])
     data = worker.load_data()
     # Пустой список не сохраняется (функция возвращается раньше)
@@ -223,41 +218,42 @@ def test_json_save_data_empty_list():
     assert isinstance(data, list)
 
 
-def test_csv_remove_data_empty_result():
+def test_csv_remove_data_empty_result(tmp_path):
     """Проверка удаления всех данных из CSV."""
-    worker = CSVFileWorker("data/test.csv")
+    worker = CSVFileWorker(str(tmp_path / "remove_all.csv"))
     worker.save_data([{"id": "1", "title": "Test"}])
     worker.remove_data(lambda x: True)  # Удалить все
     data = worker.load_data()
     assert data == []
 
 
-def test_json_clear_file_exception():
+def test_json_clear_file_exception(tmp_path):
     """Проверка обработки исключения при очистке JSON файла."""
-    worker = JSONFileWorker("data/test.json")
+    path = tmp_path / "clear_error.json"
+    worker = JSONFileWorker(str(path))
     worker.save_data([{"id": "1"}])
 
     with patch("builtins.open", side_effect=Exception("Unexpected error")):
         worker.clear_file()
     # Файл должен остаться
-    assert os.path.exists("data/test.json")
+    assert os.path.exists(path)
 
 
-def test_json_load_data_not_list():
+def test_json_load_data_not_list(tmp_path):
     """Проверка загрузки JSON файла, где корневой элемент не список."""
-    worker = JSONFileWorker("data/test_not_list.json")
-    with open(worker.filename, "w", encoding="utf-8") as f:
-        json.dump({"not": "a list"}, f, ensure_ascii=False)
+    path = tmp_path / "not_list.json"
+    path.write_text(json.dumps({"not": "a list"}, ensure_ascii=False), encoding="utf-8")
+    worker = JSONFileWorker(str(path))
 
     data = worker.load_data()
     assert data == []
 
 
-def test_json_save_data_corrupted_existing():
+def test_json_save_data_corrupted_existing(tmp_path):
     """Проверка сохранения когда существующий файл поврежден."""
-    worker = JSONFileWorker("data/test_corrupted.json")
-    with open(worker.filename, "w", encoding="utf-8") as f:
-        f.write("{invalid json}")
+    path = tmp_path / "corrupted_existing.json"
+    path.write_text("{invalid json}", encoding="utf-8")
+    worker = JSONFileWorker(str(path))
 
     worker.save_data([{"id": "1", "title": "New"}])
     data = worker.load_data()
@@ -1,6 +1,4 @@
-import os
 from decimal import Decimal
-from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
@@ -8,44 +6,58 @@ import requests
 from src.fileworker import JSONFileWorker
 from src.hh_api import HeadHunterAPI
 from src.vacancy import Vacancy
+from tests.conftest import _Resp
+
+# Повторяющиеся ответы собираются один раз на модуль
+_EMPTY_PAGE = _Resp(200, {"items": [], "pages": 0})
+_TWO_ITEMS_PAGE = _Resp(200, {
+    "items": [
+        {"id": "1", "name": "Dev", "alternate_url": "https://hh.ru/vacancy/1", "salary": {"from": 100000}},
+        {"id": "2", "name": "QA", "alternate_url": "https://hh.ru/vacancy/2", "salary": {"from": 80000}},
+    ],
+    "pages": 1,
+})
+# Трехстраничная выдача для теста пагинации: f-строки и сериализация
+# выполняются один раз при импорте модуля, а не на каждый запуск теста
+_PAGINATION_PAGES = [
+    _Resp(200, {
+        "items": [{"id": str(i), "name": f"Job{i}", "alternate_url": f"https://hh.ru/vacancy/{i}"} for i in range(5)],
+        "pages": 3,
+    }),
+    _Resp(200, {
+        "items": [{"id": str(i), "name": f"Job{i}", "alternate_url": f"https://hh.ru/vacancy/{i}"} for i in range(5, 10)],
+        "pages": 3,
+    }),
+    _Resp(200, {"items": [], "pages": 3}),
+]
+
+# Образцы вакансий для тестов, подменяющих список напрямую:
+# Vacancy строится один раз на модуль, а не в каждом тесте
+_SAMPLE_VACANCIES = [
+    Vacancy({"id": "1", "name": "Test", "alternate_url": "https://hh.ru/vacancy/1", "salary": {"from": 50000}})
+]
+_PYTHON_DEV_VACANCIES = [
+    Vacancy(
+        {
+            "id": "1",
+            "name": "Python Dev",
+            "alternate_url": "https://hh.ru/vacancy/1",
+            "salary": {"from": 150000, "to": 200000, "currency": "RUB"},
+            "address": {"city": "Москва"},
+        }
+    )
+]
 
 
 @pytest.fixture(autouse=True)
-def cleanup_test_files():
-    """Удаляет тестовые файлы после выполнения тестов."""
-    test_files = [
-        "data/hh_test.json",
-        "dummy.json",  # Тестовый файл из test_connect_to_api_* методов
-    ]
-    for f in test_files:
-        if os.path.exists(f):
-            os.remove(f)
-
-
-@pytest.fixture
-def hh_parser():
-    """Создаёт экземпляр HeadHunterAPI с тестовым JSONFileWorker."""
-    file_worker = JSONFileWorker("data/hh_test.json")
-    return HeadHunterAPI(file_worker)
+def _reset_parser(hh_parser):
+    """Сбрасывает накопленные вакансии перед каждым тестом."""
+    hh_parser.clear_vacancies()
 
 
-@patch("requests.get")
 def test_load_vacancies_success(mock_get, hh_parser):
     """Проверяет загрузку вакансий при успешном ответе API."""
-    mock_responses = [
-        MagicMock(
-            status_code=200,
-            json=lambda: {
-                "items": [
-                    {"id": "1", "name": "Dev", "alternate_url": "https://hh.ru/vacancy/1", "salary": {"from": 100000}},
-                    {"id": "2", "name": "QA", "alternate_url": "https://hh.ru/vacancy/2", "salary": {"from": 80000}},
-                ],
-                "pages": 1
-            },
-        ),
-        MagicMock(status_code=200, json=lambda: {"items": [], "pages": 0}),
-    ]
-    mock_get.side_effect = mock_responses
+    mock_get.side_effect = [_TWO_ITEMS_PAGE, _EMPTY_PAGE]
 
     hh_parser.load_vacancies("python")
 
@@ -55,106 +67,83 @@ def test_load_vacancies_success(mock_get, hh_parser):
     assert vacancies[1].salary_from == Decimal("80000")
 
 
-@patch("requests.get")
 def test_load_vacancies_empty(mock_get, hh_parser):
     """Проверяет обработку пустого ответа API (нет вакансий)."""
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"items": [], "pages": 0}
-    mock_get.return_value = mock_response
+    mock_get.return_value = _EMPTY_PAGE
 
     hh_parser.load_vacancies("python")
     assert len(hh_parser.get_vacancies()) == 0
 
 
-@patch("requests.get", side_effect=requests.RequestException("Network error"))
-def test_load_vacancies_network_error(mock_get, hh_parser, capsys):
+def test_load_vacancies_network_error(monkeypatch, hh_parser, caplog):
     """Проверяет обработку сетевой ошибки при загрузке вакансий."""
+    # Обычная функция вместо MagicMock(side_effect=...): без учета вызовов
+    # и интроспекции спецификации на каждом обращении
+    def boom(*args, **kwargs):
+        raise requests.RequestException("Network error")
+
+    monkeypatch.setattr("requests.Session.get", boom)
+
     hh_parser.load_vacancies("python")
-    captured = capsys.readouterr()
-    assert "Ошибка при загрузке вакансий" in captured.out
+    assert "Ошибка при загрузке вакансий" in caplog.text
     assert len(hh_parser.get_vacancies()) == 0
 
 
-@patch("requests.get")
-def test_load_vacancies_http_error(mock_get, hh_parser, capsys):
+def test_load_vacancies_http_error(mock_get, hh_parser, caplog):
     """Проверяет обработку HTTP‑ошибки (например, 404)."""
-    mock_response = MagicMock()
-    mock_response.status_code = 404
-    mock_get.return_value = mock_response
+    mock_get.return_value = _Resp(404)
 
     hh_parser.load_vacancies("python")
-    captured = capsys.readouterr()
-    assert "Не удалось подключиться к API" in captured.out
+    assert "Не удалось подключиться к API" in caplog.text
     assert len(hh_parser.get_vacancies()) == 0
 
 
 def test_get_vacancies(hh_parser):
     """Проверяет получение списка загруженных вакансий."""
-    hh_parser._HeadHunterAPI__vacancies = [
-        Vacancy({"id": "1", "name": "Test", "alternate_url": "https://hh.ru/vacancy/1", "salary": {"from": 50000}})
-    ]
+    hh_parser._set_vacancies_for_test(_SAMPLE_VACANCIES)
     vacancies = hh_parser.get_vacancies()
     assert len(vacancies) == 1
     assert vacancies[0].title == "Test"
 
 
-def test_save_vacancies_empty(hh_parser, capsys):
+def test_save_vacancies_empty(hh_parser, hh_file, caplog):
     """Проверяет сохранение, когда вакансий для сохранения нет."""
     hh_parser.clear_vacancies()
-    hh_parser.save_vacancies("data/hh_test.json")
-    captured = capsys.readouterr()
-    assert "Нет вакансий для сохранения" in captured.out
+    hh_parser.save_vacancies(hh_file)
+    assert "Нет вакансий для сохранения" in caplog.text
 
 
 def test_clear_vacancies(hh_parser):
     """Проверяет очистку списка загруженных вакансий."""
-    hh_parser._HeadHunterAPI__vacancies = [Vacancy({"id": "1", "name": "Test", "alternate_url": ""})]
+    hh_parser._set_vacancies_for_test(_SAMPLE_VACANCIES)
     hh_parser.clear_vacancies()
     assert len(hh_parser.get_vacancies()) == 0
 
 
-@patch("requests.get")
-def test_connect_to_api_success(mock_get):
+def test_connect_to_api_success(mock_get, tmp_path):
     """Проверяет успешное подключение к API (метод удален, тестируем через load_vacancies)."""
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"items": [], "pages": 0}
-    mock_get.return_value = mock_response
+    mock_get.return_value = _EMPTY_PAGE
 
-    parser = HeadHunterAPI(JSONFileWorker("dummy.json"))
+    parser = HeadHunterAPI(JSONFileWorker(str(tmp_path / "dummy.json")))
     parser.load_vacancies("test")
     assert len(parser.get_vacancies()) == 0
 
 
-@patch("requests.get")
-def test_connect_to_api_retries_fail(mock_get):
+def test_connect_to_api_retries_fail(mock_get, tmp_path):
     """Проверяет обработку ошибок API (метод удален, тестируем через load_vacancies)."""
-    mock_response = MagicMock()
-    mock_response.status_code = 500
-    mock_get.return_value = mock_response
+    mock_get.return_value = _Resp(500)
 
-    parser = HeadHunterAPI(JSONFileWorker("dummy.json"))
+    parser = HeadHunterAPI(JSONFileWorker(str(tmp_path / "dummy.json")))
     parser.load_vacancies("test")
     # При ошибке вакансии не загружаются
     assert len(parser.get_vacancies()) == 0
 
 
-def test_save_vacancies_file_content(hh_parser):
+def test_save_vacancies_file_content(hh_parser, hh_file):
     """Проверяет содержимое файла после сохранения вакансий."""
-    hh_parser._HeadHunterAPI__vacancies = [
-        Vacancy(
-            {
-                "id": "1",
-                "name": "Python Dev",
-                "alternate_url": "https://hh.ru/vacancy/1",
-                "salary": {"from": 150000, "to": 200000, "currency": "RUB"},
-                "address": {"city": "Москва"},
-            }
-        )
-    ]
+    hh_parser._set_vacancies_for_test(_PYTHON_DEV_VACANCIES)
 
-    hh_parser.save_vacancies("data/hh_test.json")
+    hh_parser.save_vacancies(hh_file)
     loaded = hh_parser._HeadHunterAPI__file_worker.load_data()
 
     assert len(loaded) == 1
@@ -163,93 +152,109 @@ def test_save_vacancies_file_content(hh_parser):
     assert loaded[0]["city"] == "Москва"
 
 
-@patch("requests.get")
-def test_load_vacancies_non_dict_item(mock_get, hh_parser, capsys):
+def test_load_vacancies_non_dict_item(mock_get, hh_parser, caplog):
     """Проверяет обработку некорректных записей (не словарей)."""
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
+    mock_get.return_value = _Resp(200, {
         "items": [
             {"id": "1", "name": "Valid", "alternate_url": "https://hh.ru/vacancy/1"},
             "invalid string",  # Некорректная запись
             {"id": "2", "name": "Valid2", "alternate_url": "https://hh.ru/vacancy/2"},
         ],
         "pages": 1,
-    }
-    mock_get.return_value = mock_response
+    })
 
     hh_parser.load_vacancies("python")
-    captured = capsys.readouterr()
-    assert "Пропущена некорректная запись" in captured.out
+    assert "Пропущена некорректная запись" in caplog.text
     vacancies = hh_parser.get_vacancies()
     assert len(vacancies) == 2
 
 
-@patch("requests.get")
-def test_load_vacancies_invalid_vacancy(mock_get, hh_parser, capsys):
+def test_load_vacancies_invalid_vacancy(mock_get, hh_parser, caplog):
     """Проверяет обработку невалидных вакансий."""
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
+    mock_get.return_value = _Resp(200, {
         "items": [
             {"id": "1", "name": "Valid", "alternate_url": "https://hh.ru/vacancy/1"},
             {"id": "2", "name": "", "alternate_url": "invalid-url"},  # Невалидный URL
         ],
         "pages": 1,
-    }
-    mock_get.return_value = mock_response
+    })
 
     hh_parser.load_vacancies("python")
-    captured = capsys.readouterr()
-    assert "Пропущена некорректная вакансия" in captured.out
+    assert "Пропущена некорректная вакансия" in caplog.text
     vacancies = hh_parser.get_vacancies()
     assert len(vacancies) == 1
 
 
-@patch("requests.get")
 def test_load_vacancies_pagination(mock_get, hh_parser):
     """Проверяет пагинацию при загрузке вакансий."""
-    mock_responses = [
-        MagicMock(
-            status_code=200,
-            json=lambda: {
-                "items": [{"id": str(i), "name": f"Job{i}", "alternate_url": f"https://hh.ru/vacancy/{i}"} for i in range(5)],
-                "pages": 3,
-            },
-        ),
-        MagicMock(
-            status_code=200,
-            json=lambda: {
-                "items": [{"id": str(i), "name": f"Job{i}", "alternate_url": f"https://hh.ru/vacancy/{i}"} for i in range(5, 10)],
-                "pages": 3,
-            },
-        ),
-        MagicMock(status_code=200, json=lambda: {"items": [], "pages": 3}),
-    ]
-    mock_get.side_effect = mock_responses
+    mock_get.side_effect = _PAGINATION_PAGES
 
     hh_parser.load_vacancies("python")
     vacancies = hh_parser.get_vacancies()
     assert len(vacancies) == 10
 
 
-@patch("requests.get")
-def test_connect_to_api_rate_limit(mock_get, hh_parser, capsys):
+def test_load_vacancies_etag_cache(mock_get, tmp_path):
+    """Проверяет условные запросы: 304 отдает разобранный ответ из кэша."""
+    first = _Resp(200, {
+        "items": [{"id": "1", "name": "Dev", "alternate_url": "https://hh.ru/vacancy/1"}],
+        "pages": 1,
+    })
+    first.headers = {"ETag": '"v1"'}
+    mock_get.side_effect = [first, _Resp(304)]
+
+    parser = HeadHunterAPI(JSONFileWorker(str(tmp_path / "dummy.json")))
+    parser.load_vacancies("python")
+    assert len(parser.get_vacancies()) == 1
+
+    # Повторная загрузка: уходит If-None-Match, тело 304 пустое,
+    # вакансии строятся из закэшированного разбора первой страницы
+    parser.load_vacancies("python")
+    vacancies = parser.get_vacancies()
+    assert len(vacancies) == 1
+    assert vacancies[0].title == "Dev"
+
+    first_headers = mock_get.call_args_list[0].kwargs.get("headers")
+    second_headers = mock_get.call_args_list[1].kwargs.get("headers")
+    assert first_headers is None
+    assert second_headers == {"If-None-Match": '"v1"'}
+
+
+def test_load_vacancies_parallel_build(mock_get, hh_parser, monkeypatch):
+    """Проверяет разбор страниц пулом процессов на крупной выдаче.
+
+    Порог понижается, чтобы ветка пула срабатывала на компактных
+    тестовых данных вместо полной выдачи в 2000 записей.
+    """
+    monkeypatch.setattr("src.hh_api._PARALLEL_ITEMS_THRESHOLD", 150)
+    mock_get.side_effect = [
+        _Resp(200, {
+            "items": [
+                {"id": str(i), "name": f"Job{i}", "alternate_url": f"https://hh.ru/vacancy/{i}"}
+                for i in range(start, start + 100)
+            ],
+            "pages": 2,
+        })
+        for start in (0, 100)
+    ]
+
+    hh_parser.load_vacancies("python")
+    vacancies = hh_parser.get_vacancies()
+    assert len(vacancies) == 200
+    assert vacancies[150].title == "Job150"
+
+
+def test_connect_to_api_rate_limit(mock_get, hh_parser):
     """Проверяет обработку ошибки rate limit (429)."""
-    mock_response = MagicMock()
-    mock_response.status_code = 429
-    mock_get.return_value = mock_response
+    mock_get.return_value = _Resp(429)
 
     with pytest.raises(requests.HTTPError, match="Превышен лимит запросов"):
         hh_parser.connect_to_api()
 
 
-@patch("requests.get")
 def test_connect_to_api_non_200(mock_get, hh_parser):
     """Проверяет обработку не-200 статус кода."""
-    mock_response = MagicMock()
-    mock_response.status_code = 404
-    mock_get.return_value = mock_response
+    mock_get.return_value = _Resp(404)
 
     with pytest.raises(requests.HTTPError, match="Не удалось подключиться к API"):
         hh_parser.connect_to_api()
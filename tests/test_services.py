@@ -5,6 +5,8 @@ import pytest
 
 from src.services import (
     clean_html,
+    clean_html_batch,
+    clean_html_pair,
     extract_probation_period,
     validate_title,
     validate_url,
@@ -30,27 +32,26 @@ def test_validate_title_normal():
     assert validate_title("Software Engineer") == "Software Engineer"
 
 
-def test_validate_url_valid():
-    """Тестирование validate_url с валидными URL."""
-    assert validate_url("https://hh.ru/vacancy/123") == "https://hh.ru/vacancy/123"
-    assert validate_url("http://example.com") == "http://example.com"
-    assert validate_url("https://example.com/vacancy") == "https://example.com/vacancy"
-
-
-def test_validate_url_empty():
-    """Тестирование validate_url с пустой строкой."""
-    assert validate_url("") == ""
-    assert validate_url("   ") == ""
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("https://hh.ru/vacancy/123", "https://hh.ru/vacancy/123"),
+        ("http://example.com", "http://example.com"),
+        ("https://example.com/vacancy", "https://example.com/vacancy"),
+        ("", ""),
+        ("   ", ""),
+    ],
+)
+def test_validate_url_valid(url, expected):
+    """Тестирование validate_url с валидными и пустыми URL."""
+    assert validate_url(url) == expected
 
 
-def test_validate_url_invalid():
+@pytest.mark.parametrize("url", ["ftp://invalid", "invalid-url", "just text"])
+def test_validate_url_invalid(url):
     """Тестирование validate_url с невалидными URL."""
     with pytest.raises(ValueError, match="Некорректный URL"):
-        validate_url("ftp://invalid")
-    with pytest.raises(ValueError, match="Некорректный URL"):
-        validate_url("invalid-url")
-    with pytest.raises(ValueError, match="Некорректный URL"):
-        validate_url("just text")
+        validate_url(url)
 
 
 def test_validate_url_with_whitespace():
@@ -77,41 +78,55 @@ def test_clean_html_no_tags():
     assert clean_html("Text without tags") == "Text without tags"
 
 
-def test_extract_probation_period_months():
-    """Тестирование extract_probation_period с месяцами."""
-    assert extract_probation_period("Испытательный срок 3 месяца") == "3 месяца"
-    assert extract_probation_period("Срок 6 месяц") == "6 месяца"
-    assert extract_probation_period("1 месяц испытания") == "1 месяца"
-
-
-def test_extract_probation_period_weeks():
-    """Тестирование extract_probation_period с неделями."""
-    assert extract_probation_period("Испытательный срок 2 недели") == "2 недели"
-    assert extract_probation_period("Срок 4 недели") == "4 недели"
-
-
-def test_extract_probation_period_days():
-    """Тестирование extract_probation_period с днями."""
-    assert extract_probation_period("Испытательный срок 7 день") == "7 дня"
-    assert extract_probation_period("Срок 14 день") == "14 дня"
-
-
-def test_extract_probation_period_years():
-    """Тестирование extract_probation_period с годами."""
-    assert extract_probation_period("Испытательный срок 1 год") == "1 года"
-    assert extract_probation_period("Срок 2 года") == "2 года"
-
-
-def test_extract_probation_period_not_found():
-    """Тестирование extract_probation_period когда не найдено."""
-    assert extract_probation_period("Нет испытательного срока") is None
-    assert extract_probation_period("") is None
-    assert extract_probation_period("Просто текст") is None
-
-
-def test_extract_probation_period_case_insensitive():
-    """Тестирование extract_probation_period без учета регистра."""
-    # Тест проверяет что функция работает с разными вариантами написания
-    assert extract_probation_period("Испытательный срок 3 месяц") == "3 месяца"
-    assert extract_probation_period("Испытательный срок 2 недел") == "2 недели"
+def test_clean_html_pair():
+    """Тестирование парной очистки HTML: оба текста чистятся за один проход."""
+    assert clean_html_pair("<p>Text</p>", "<b>Bold</b> text") == ("Text", "Bold text")
+    assert clean_html_pair("", "") == ("", "")
+
+
+def test_clean_html_pair_bare_angle_brackets():
+    """Голые < и > в разных текстах не пересекают границу записей."""
+    first, second = clean_html_pair("опыт < 5 лет", "знание C++ > шаблонов")
+    assert first == "опыт < 5 лет"
+    assert second == "знание C++ > шаблонов"
+    # Паритет с по-полевой очисткой
+    assert first == clean_html("опыт < 5 лет")
+    assert second == clean_html("знание C++ > шаблонов")
+
+
+def test_clean_html_batch():
+    """Тестирование батчевой очистки HTML: порядок и пустые тексты сохраняются."""
+    texts = ["<p>Text</p>", "", "Plain text", "<b>Bold</b> and <i>italic</i>"]
+    assert clean_html_batch(texts) == ["Text", "", "Plain text", "Bold and italic"]
+    assert clean_html_batch([]) == []
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        # Месяцы
+        ("Испытательный срок 3 месяца", "3 месяца"),
+        ("Срок 6 месяц", "6 месяца"),
+        ("1 месяц испытания", "1 месяца"),
+        # Недели
+        ("Испытательный срок 2 недели", "2 недели"),
+        ("Срок 4 недели", "4 недели"),
+        # Дни
+        ("Испытательный срок 7 день", "7 дня"),
+        ("Срок 14 день", "14 дня"),
+        # Годы
+        ("Испытательный срок 1 год", "1 года"),
+        ("Срок 2 года", "2 года"),
+        # Не найдено
+        ("Нет испытательного срока", None),
+        ("", None),
+        ("Просто текст", None),
+        # Разные варианты написания
+        ("Испытательный срок 3 месяц", "3 месяца"),
+        ("Испытательный срок 2 недел", "2 недели"),
+    ],
+)
+def test_extract_probation_period(text, expected):
+    """Тестирование extract_probation_period на всех вариантах написания."""
+    assert extract_probation_period(text) == expected
 
@@ -1,9 +1,21 @@
+import operator
 from decimal import Decimal
 
 import pytest
 
 from src.services import clean_html, extract_probation_period
 from src.vacancy import Vacancy
+from tests.conftest import make_raw, make_saved
+
+
+def _assert_attrs(vacancy, expected):
+    """Сверяет атрибуты вакансии с ожидаемыми значениями кейса."""
+    for attr, value in expected.items():
+        result = getattr(vacancy, attr)
+        if isinstance(value, bool):
+            assert result is value
+        else:
+            assert result == value
 
 
 def test_vacancy_init_minimal_data():
@@ -69,53 +81,90 @@ def test_vacancy_extract_probation():
     assert extract_probation_period(text1) == "3 месяца"
 
 
-def test_vacancy_salary_info():
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        pytest.param(
+            {"name": "No Salary", "alternate_url": ""},
+            "Зарплата не указана",
+            id="no_salary",
+        ),
+        pytest.param(
+            {
+                "name": "Fixed",
+                "alternate_url": "",
+                "salary": {"from": 100000, "to": 100000, "currency": "USD", "gross": False},
+            },
+            "100,000 USD (net)",
+            id="fixed",
+        ),
+        pytest.param(
+            {
+                "name": "Range",
+                "alternate_url": "",
+                "salary": {"from": 80000, "to": 120000, "currency": "RUB", "gross": True},
+            },
+            "от 80,000 до 120,000 RUB (gross)",
+            id="range",
+        ),
+    ],
+)
+def test_vacancy_salary_info(data, expected):
     """Тестирование свойства salary_info."""
-    vacancy1 = Vacancy({"name": "No Salary", "alternate_url": ""})
-    assert vacancy1.salary_info == "Зарплата не указана"
-
-    data2 = {
-        "name": "Fixed",
-        "alternate_url": "",
-        "salary": {"from": 100000, "to": 100000, "currency": "USD", "gross": False},
-    }
-    vacancy2 = Vacancy(data2)
-    assert vacancy2.salary_info == "100,000 USD (net)"
-
-    data3 = {
-        "name": "Range",
-        "alternate_url": "",
-        "salary": {"from": 80000, "to": 120000, "currency": "RUB", "gross": True},
-    }
-    vacancy3 = Vacancy(data3)
-    assert vacancy3.salary_info == "от 80,000 до 120,000 RUB (gross)"
-
-
-def test_vacancy_average_salary():
-    vacancy1 = Vacancy({"name": "No Salary", "alternate_url": ""})
-    assert vacancy1.average_salary() == Decimal("0")
-
-    data2 = {"name": "Fixed", "alternate_url": "", "salary": {"from": 100000, "to": 100000}}
-    vacancy2 = Vacancy(data2)
-    assert vacancy2.average_salary() == Decimal("100000")
-
-    data3 = {"name": "Range", "alternate_url": "", "salary": {"from": 80000, "to": 120000}}
-    vacancy3 = Vacancy(data3)
-    assert vacancy3.average_salary() == Decimal("100000")
-
-
-def test_vacancy_comparison_operators():
-    v1 = Vacancy({"name": "A", "alternate_url": "", "salary": {"from": 50000}})
-    v2 = Vacancy({"name": "B", "alternate_url": "", "salary": {"from": 100000}})
-    v3 = Vacancy({"name": "C", "alternate_url": "", "salary": {"from": 100000}})
-
-    assert v1 < v2
-    assert v2 > v1
-    assert v2 >= v3
-    assert v2 <= v3
-    assert v2 == v3
-    assert v1 != v2
-
+    assert Vacancy(data).salary_info == expected
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        pytest.param({"name": "No Salary", "alternate_url": ""}, Decimal("0"), id="no_salary"),
+        pytest.param(
+            {"name": "Fixed", "alternate_url": "", "salary": {"from": 100000, "to": 100000}},
+            Decimal("100000"),
+            id="fixed",
+        ),
+        pytest.param(
+            {"name": "Range", "alternate_url": "", "salary": {"from": 80000, "to": 120000}},
+            Decimal("100000"),
+            id="range",
+        ),
+    ],
+)
+def test_vacancy_average_salary(data, expected):
+    assert Vacancy(data).average_salary() == expected
+
+
+@pytest.fixture(scope="module")
+def cmp_vacancies():
+    """Тройка вакансий для операторов сравнения: строится один раз на модуль.
+
+    Сравнения не мутируют экземпляры, поэтому общий набор безопасен.
+    """
+    return (
+        Vacancy(make_raw(name="A", salary={"from": 50000})),
+        Vacancy(make_raw(name="B", salary={"from": 100000})),
+        Vacancy(make_raw(name="C", salary={"from": 100000})),
+    )
+
+
+@pytest.mark.parametrize(
+    "op,left,right",
+    [
+        pytest.param(operator.lt, 0, 1, id="lt"),
+        pytest.param(operator.gt, 1, 0, id="gt"),
+        pytest.param(operator.ge, 1, 2, id="ge"),
+        pytest.param(operator.le, 1, 2, id="le"),
+        pytest.param(operator.eq, 1, 2, id="eq"),
+        pytest.param(operator.ne, 0, 1, id="ne"),
+    ],
+)
+def test_vacancy_comparison_operators(cmp_vacancies, op, left, right):
+    assert op(cmp_vacancies[left], cmp_vacancies[right]) is True
+
+
+def test_vacancy_eq_non_vacancy(cmp_vacancies):
+    """Сравнение с объектом другого типа не возвращает NotImplemented."""
+    v1 = cmp_vacancies[0]
     assert not (v1 == "not a vacancy")
     assert (v1 == "not a vacancy") is not NotImplemented
 
@@ -133,23 +182,46 @@ def test_vacancy_str_and_repr():
     assert "salary_from=100000" in repr(vacancy)
 
 
+# Крупные статичные записи собираются один раз при импорте модуля:
+# конструктор Vacancy читает их через .get и не мутирует
+_SAMPLE_DATA_FULL = {
+    "id": "1",
+    "name": "Python Developer",
+    "alternate_url": "https://hh.ru/vacancy/123",
+    "employer": {"name": "TechCo", "alternate_url": "https://hh.ru/employer/456"},
+    "salary": {"from": 100000, "to": 150000, "currency": "RUB", "gross": True},
+    "snippet": {
+        "responsibility": "<p>Разработка API на <b>Django</b></p>",
+        "requirement": "Опыт работы с <i>PostgreSQL</i>",
+    },
+    "experience": {"name": "1-3 года"},
+    "address": {"city": "Москва", "street": "Ленина", "building": "10"},
+}
+
+_SAVED_DATA_FULL = {
+    "id": "123",
+    "title": "Python Developer",
+    "url": "https://hh.ru/vacancy/123",
+    "employer_name": "TechCorp",
+    "employer_url": "https://hh.ru/employer/456",
+    "salary_from": 100000,
+    "salary_to": 150000,
+    "currency": "RUB",
+    "gross": True,
+    "city": "Москва",
+    "street": "Ленина",
+    "building": "10",
+    "responsibilities": "Разработка приложений",
+    "requirements": "Опыт Python",
+    "professional_roles": ["Разработчик", "Backend"],
+    "experience": "3-5 лет",
+    "probation_period": "3 месяца",
+}
+
+
 def test_vacancy_to_dict_full():
     """Тестирование to_dict с полными данными."""
-    sample_data = {
-        "id": "1",
-        "name": "Python Developer",
-        "alternate_url": "https://hh.ru/vacancy/123",
-        "employer": {"name": "TechCo", "alternate_url": "https://hh.ru/employer/456"},
-        "salary": {"from": 100000, "to": 150000, "currency": "RUB", "gross": True},
-        "snippet": {
-            "responsibility": "<p>Разработка API на <b>Django</b></p>",
-            "requirement": "Опыт работы с <i>PostgreSQL</i>",
-        },
-        "experience": {"name": "1-3 года"},
-        "address": {"city": "Москва", "street": "Ленина", "building": "10"},
-    }
-
-    vacancy = Vacancy(sample_data)
+    vacancy = Vacancy(_SAMPLE_DATA_FULL)
     result = vacancy.to_dict()
 
     assert result["id"] == "1"
@@ -251,26 +323,7 @@ def test_vacancy_employer_url_optional():
 
 def test_vacancy_saved_format():
     """Тестирование загрузки вакансии из сохраненного формата."""
-    saved_data = {
-        "id": "123",
-        "title": "Python Developer",
-        "url": "https://hh.ru/vacancy/123",
-        "employer_name": "TechCorp",
-        "employer_url": "https://hh.ru/employer/456",
-        "salary_from": 100000,
-        "salary_to": 150000,
-        "currency": "RUB",
-        "gross": True,
-        "city": "Москва",
-        "street": "Ленина",
-        "building": "10",
-        "responsibilities": "Разработка приложений",
-        "requirements": "Опыт Python",
-        "professional_roles": ["Разработчик", "Backend"],
-        "experience": "3-5 лет",
-        "probation_period": "3 месяца",
-    }
-    vacancy = Vacancy(saved_data)
+    vacancy = Vacancy(_SAVED_DATA_FULL)
     assert vacancy.id == "123"
     assert vacancy.title == "Python Developer"
     assert vacancy.url == "https://hh.ru/vacancy/123"
@@ -281,227 +334,133 @@ def test_vacancy_saved_format():
     assert vacancy.professional_roles == ["Разработчик", "Backend"]
 
 
-def test_vacancy_saved_format_string_salary():
-    """Тестирование сохраненного формата со строковой зарплатой."""
-    saved_data = {
-        "id": "123",
-        "title": "Dev",
-        "url": "https://hh.ru/vacancy/123",
-        "salary_from": "100000",
-        "salary_to": "150000",
-        "currency": "RUB",
-        "gross": "true",
-    }
-    vacancy = Vacancy(saved_data)
-    assert vacancy.salary_from == Decimal("100000")
-    assert vacancy.salary_to == Decimal("150000")
-    assert vacancy.gross is True
-
-
-def test_vacancy_saved_format_empty_salary():
-    """Тестирование сохраненного формата с пустой зарплатой."""
-    saved_data = {
-        "id": "123",
-        "title": "Dev",
-        "url": "https://hh.ru/vacancy/123",
-        "salary_from": "",
-        "salary_to": None,
-    }
-    vacancy = Vacancy(saved_data)
-    assert vacancy.salary_from == Decimal("0")
-    assert vacancy.salary_to == Decimal("0")
-
-
-def test_vacancy_saved_format_professional_roles_string():
-    """Тестирование сохраненного формата с профессиональными ролями как строкой."""
-    saved_data = {
-        "id": "123",
-        "title": "Dev",
-        "url": "https://hh.ru/vacancy/123",
-        "professional_roles": "['Разработчик', 'Backend']",
-    }
-    vacancy = Vacancy(saved_data)
-    assert vacancy.professional_roles == ["Разработчик", "Backend"]
-
-
-def test_vacancy_saved_format_professional_roles_invalid_string():
-    """Тестирование сохраненного формата с невалидной строкой ролей."""
-    saved_data = {
-        "id": "123",
-        "title": "Dev",
-        "url": "https://hh.ru/vacancy/123",
-        "professional_roles": "invalid string",
-    }
-    vacancy = Vacancy(saved_data)
-    assert vacancy.professional_roles == []
-
-
-def test_vacancy_saved_format_without_probation():
-    """Тестирование сохраненного формата без испытательного срока."""
-    saved_data = {
-        "id": "123",
-        "title": "Dev",
-        "url": "https://hh.ru/vacancy/123",
-        "responsibilities": "Разработка",
-        "requirements": "Испытательный срок 3 месяца",
-    }
-    vacancy = Vacancy(saved_data)
-    assert vacancy.probation_period == "3 месяца"
-
-
-def test_vacancy_salary_conversion_error():
-    """Тестирование обработки ошибок при конвертации зарплаты."""
-    saved_data = {
-        "id": "123",
-        "title": "Dev",
-        "url": "https://hh.ru/vacancy/123",
-        "salary_from": "invalid",
-        "salary_to": "also_invalid",
-    }
-    vacancy = Vacancy(saved_data)
-    assert vacancy.salary_from == Decimal("0")
-    assert vacancy.salary_to == Decimal("0")
-
-
-def test_vacancy_gross_false_string():
-    """Тестирование gross как строки False."""
-    saved_data = {
-        "id": "123",
-        "title": "Dev",
-        "url": "https://hh.ru/vacancy/123",
-        "gross": "false",
-    }
-    vacancy = Vacancy(saved_data)
-    assert vacancy.gross is False
-
-
-def test_vacancy_gross_none():
-    """Тестирование gross как None."""
-    saved_data = {
-        "id": "123",
-        "title": "Dev",
-        "url": "https://hh.ru/vacancy/123",
-        "gross": None,
-    }
-    vacancy = Vacancy(saved_data)
-    assert vacancy.gross is True
-
-
-def test_vacancy_raw_format_no_salary():
-    """Тестирование сырого формата без зарплаты."""
-    raw_data = {
-        "id": "123",
-        "name": "Dev",
-        "alternate_url": "https://hh.ru/vacancy/123",
-        "salary": None,
-    }
-    vacancy = Vacancy(raw_data)
-    assert vacancy.salary_from == Decimal("0")
-    assert vacancy.salary_to == Decimal("0")
-    assert vacancy.currency == "RUB"
-    assert vacancy.gross is True
-
-
-def test_vacancy_raw_format_salary_not_dict():
-    """Тестирование сырого формата где salary не словарь."""
-    raw_data = {
-        "id": "123",
-        "name": "Dev",
-        "alternate_url": "https://hh.ru/vacancy/123",
-        "salary": "not a dict",
-    }
-    vacancy = Vacancy(raw_data)
-    assert vacancy.salary_from == Decimal("0")
-    assert vacancy.salary_to == Decimal("0")
-
-
-def test_vacancy_raw_format_float_salary():
-    """Тестирование сырого формата с float зарплатой."""
-    raw_data = {
-        "id": "123",
-        "name": "Dev",
-        "alternate_url": "https://hh.ru/vacancy/123",
-        "salary": {"from": 100000.5, "to": 150000.7, "currency": "RUB"},
-    }
-    vacancy = Vacancy(raw_data)
-    assert vacancy.salary_from == Decimal("100000")
-    assert vacancy.salary_to == Decimal("150000")
-
-
-def test_vacancy_raw_format_no_address():
-    """Тестирование сырого формата без адреса."""
-    raw_data = {
-        "id": "123",
-        "name": "Dev",
-        "alternate_url": "https://hh.ru/vacancy/123",
-        "address": None,
-    }
-    vacancy = Vacancy(raw_data)
-    assert vacancy.city == "Не указан"
-    assert vacancy.street == ""
-    assert vacancy.building == ""
-
-
-def test_vacancy_raw_format_address_not_dict():
-    """Тестирование сырого формата где address не словарь."""
-    raw_data = {
-        "id": "123",
-        "name": "Dev",
-        "alternate_url": "https://hh.ru/vacancy/123",
-        "address": "not a dict",
-    }
-    vacancy = Vacancy(raw_data)
-    assert vacancy.city == "Не указан"
-
-
-def test_vacancy_raw_format_no_snippet():
-    """Тестирование сырого формата без snippet."""
-    raw_data = {
-        "id": "123",
-        "name": "Dev",
-        "alternate_url": "https://hh.ru/vacancy/123",
-        "snippet": None,
-    }
-    vacancy = Vacancy(raw_data)
-    assert vacancy.responsibilities == ""
-    assert vacancy.requirements == ""
-
-
-def test_vacancy_raw_format_snippet_not_dict():
-    """Тестирование сырого формата где snippet не словарь."""
-    raw_data = {
-        "id": "123",
-        "name": "Dev",
-        "alternate_url": "https://hh.ru/vacancy/123",
-        "snippet": "not a dict",
-    }
-    vacancy = Vacancy(raw_data)
-    assert vacancy.responsibilities == ""
-    assert vacancy.requirements == ""
-
-
-def test_vacancy_raw_format_no_experience():
-    """Тестирование сырого формата без опыта."""
-    raw_data = {
-        "id": "123",
-        "name": "Dev",
-        "alternate_url": "https://hh.ru/vacancy/123",
-        "experience": None,
-    }
-    vacancy = Vacancy(raw_data)
-    assert vacancy.experience == "Не указан"
-
-
-def test_vacancy_raw_format_experience_not_dict():
-    """Тестирование сырого формата где experience не словарь."""
-    raw_data = {
-        "id": "123",
-        "name": "Dev",
-        "alternate_url": "https://hh.ru/vacancy/123",
-        "experience": "not a dict",
-    }
-    vacancy = Vacancy(raw_data)
-    assert vacancy.experience == "Не указан"
+@pytest.mark.parametrize(
+    "extra,expected",
+    [
+        pytest.param(
+            {"salary_from": "100000", "salary_to": "150000", "currency": "RUB", "gross": "true"},
+            {"salary_from": Decimal("100000"), "salary_to": Decimal("150000"), "gross": True},
+            id="string_salary",
+        ),
+        pytest.param(
+            {"salary_from": "", "salary_to": None},
+            {"salary_from": Decimal("0"), "salary_to": Decimal("0")},
+            id="empty_salary",
+        ),
+        pytest.param(
+            {"professional_roles": "['Разработчик', 'Backend']"},
+            {"professional_roles": ["Разработчик", "Backend"]},
+            id="professional_roles_string",
+        ),
+        pytest.param(
+            {"professional_roles": "invalid string"},
+            {"professional_roles": []},
+            id="professional_roles_invalid_string",
+        ),
+        pytest.param(
+            {"responsibilities": "Разработка", "requirements": "Испытательный срок 3 месяца"},
+            {"probation_period": "3 месяца"},
+            id="without_probation",
+        ),
+        pytest.param(
+            {"salary_from": "invalid", "salary_to": "also_invalid"},
+            {"salary_from": Decimal("0"), "salary_to": Decimal("0")},
+            id="salary_conversion_error",
+        ),
+        pytest.param({"gross": "false"}, {"gross": False}, id="gross_false_string"),
+        pytest.param({"gross": None}, {"gross": True}, id="gross_none"),
+    ],
+)
+def test_vacancy_saved_format_fields(extra, expected):
+    """Тестирование нормализации отдельных полей сохраненного формата."""
+    _assert_attrs(Vacancy(make_saved(**extra)), expected)
+
+
+@pytest.mark.parametrize(
+    "extra,expected",
+    [
+        pytest.param(
+            {"salary": None},
+            {
+                "salary_from": Decimal("0"),
+                "salary_to": Decimal("0"),
+                "currency": "RUB",
+                "gross": True,
+            },
+            id="no_salary",
+        ),
+        pytest.param(
+            {"salary": "not a dict"},
+            {"salary_from": Decimal("0"), "salary_to": Decimal("0")},
+            id="salary_not_dict",
+        ),
+        pytest.param(
+            {"salary": {"from": 100000.5, "to": 150000.7, "currency": "RUB"}},
+            {"salary_from": Decimal("100000"), "salary_to": Decimal("150000")},
+            id="float_salary",
+        ),
+        pytest.param(
+            {"address": None},
+            {"city": "Не указан", "street": "", "building": ""},
+            id="no_address",
+        ),
+        pytest.param({"address": "not a dict"}, {"city": "Не указан"}, id="address_not_dict"),
+        pytest.param(
+            {"snippet": None},
+            {"responsibilities": "", "requirements": ""},
+            id="no_snippet",
+        ),
+        pytest.param(
+            {"snippet": "not a dict"},
+            {"responsibilities": "", "requirements": ""},
+            id="snippet_not_dict",
+        ),
+        pytest.param({"experience": None}, {"experience": "Не указан"}, id="no_experience"),
+        pytest.param(
+            {"experience": "not a dict"}, {"experience": "Не указан"}, id="experience_not_dict"
+        ),
+    ],
+)
+def test_vacancy_raw_format_defaults(extra, expected):
+    """Тестирование значений по умолчанию при неполном сыром формате."""
+    _assert_attrs(Vacancy(make_raw(**extra)), expected)
+
+
+def test_vacancy_from_records_batch():
+    """Тестирование батчевого построения вакансий из сохраненных записей."""
+    records = [
+        make_saved(responsibilities="<p>Разработка <b>API</b></p>"),
+        "not a mapping",  # Некорректная запись пропускается
+        make_saved(
+            id="124",
+            title="QA",
+            requirements="Опыт с <i>pytest</i>",
+            professional_roles="['Разработчик', 'Backend']",
+        ),
+        make_saved(id="125", professional_roles="['Разработчик', 'Backend']"),
+    ]
+    vacancies = Vacancy.from_records(records)
+
+    assert [v.id for v in vacancies] == ["123", "124", "125"]
+    assert vacancies[0].responsibilities == "Разработка API"
+    assert vacancies[1].requirements == "Опыт с pytest"
+    # Повторяющаяся строка ролей парсится один раз на батч
+    assert vacancies[1].professional_roles == ["Разработчик", "Backend"]
+    assert vacancies[2].professional_roles == ["Разработчик", "Backend"]
+
+
+def test_vacancy_from_records_bare_angle_brackets():
+    """Голые < и > в сниппетах разных записей не ломают батчевую очистку."""
+    records = [
+        make_saved(responsibilities="зарплата < 100k"),
+        make_saved(id="124", requirements="опыт > 3 лет"),
+    ]
+    vacancies = Vacancy.from_records(records)
+
+    assert len(vacancies) == 2
+    assert vacancies[0].responsibilities == "зарплата < 100k"
+    assert vacancies[0].requirements == ""
+    assert vacancies[1].requirements == "опыт > 3 лет"
 
 
 def test_vacancy_to_dict_with_zero_salary():